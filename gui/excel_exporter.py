@@ -0,0 +1,55 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from handlers import ExcelHandler
+
+
+class ExcelExportWorker(QThread):
+    """현재 화면의 행을 원본 데이터프레임과 상태 배열에서 바로 읽어 엑셀로 저장하는 작업 스레드"""
+
+    # 저장한 행 수, 전체 행 수
+    progress = pyqtSignal(int, int)
+    # 저장한 파일 경로
+    saved = pyqtSignal(str)
+    # 오류 메시지
+    failed = pyqtSignal(str)
+
+    STATUS_NAMES = ["미정", "선정", "대기", "제외", "완료"]
+    CHUNK_SIZE = 1000  # 원본 칼럼 값을 한 번에 꺼내는 행 수
+
+    def __init__(self, file_path, df, headers, positions, row_ids, snapshot, parent=None):
+        """
+        초기화
+
+        Args:
+            file_path: 저장할 엑셀 파일 경로
+            df: 원본 데이터프레임 참조 (읽기만 함, 복사하지 않음 - 제자리에서 바뀌지 않고 새 파일을 불러오면 교체만 됨)
+            headers: 저장할 헤더 (상태, 지정상품, 지정채널, 표시 칼럼 순서)
+            positions: 표시 칼럼의 원본 데이터프레임 칼럼 위치
+            row_ids: 저장할 행 ID 배열 (화면 순서)
+            snapshot: WorkState.snapshot_rows(row_ids) 결과 (상태, 지정상품, 지정채널 배열 사본)
+        """
+        super().__init__(parent)
+        self.file_path = file_path
+        self.df = df
+        self.headers = list(headers)
+        self.positions = list(positions)
+        self.row_ids = row_ids
+        self.statuses, self.products, self.channels = snapshot
+
+    def run(self):
+        try:
+            ExcelHandler.export_rows(self.file_path, self.headers, self.rows(), len(self.row_ids),
+                                     self.progress.emit)
+            self.saved.emit(self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def rows(self):
+        """저장할 행을 하나씩 생성 (원본 값은 CHUNK_SIZE 행씩만 꺼냄, 셀 문자열은 화면 표시와 같음)"""
+        for start in range(0, len(self.row_ids), self.CHUNK_SIZE):
+            chunk = self.row_ids[start:start + self.CHUNK_SIZE]
+            columns = [self.df.iloc[chunk, position].tolist() for position in self.positions]
+            for offset in range(len(chunk)):
+                i = start + offset
+                yield [self.STATUS_NAMES[self.statuses[i]], self.products[i], self.channels[i],
+                       *(str(column[offset]) for column in columns)]
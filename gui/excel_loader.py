@@ -0,0 +1,70 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from handlers import ExcelHandler, ProductIndex, ChannelIndex, SearchIndex, IdentityClusters
+
+
+class ExcelLoadWorker(QThread):
+    """엑셀 파일 읽기, 전처리, 색인 생성을 GUI 스레드 밖에서 수행하는 작업 스레드"""
+
+    # 읽은 행 수, 전체 행 수 (전체를 모르면 0)
+    progress = pyqtSignal(int, int)
+    # 화면에 바로 연결할 수 있는 로드 결과 딕셔너리
+    loaded = pyqtSignal(object)
+    # 오류 메시지
+    failed = pyqtSignal(str)
+    # 사용자가 취소함
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path, header_mapping, channel_list, parent=None):
+        """
+        초기화
+
+        Args:
+            file_path: 엑셀 파일 경로
+            header_mapping: 헤더 매핑 정보 (ExcelViewer.header_mapping)
+            channel_list: 채널 체크박스 순서대로의 채널 이름 목록
+        """
+        super().__init__(parent)
+        self.file_path = file_path
+        self.header_mapping = dict(header_mapping)
+        self.channel_list = list(channel_list)
+
+    def run(self):
+        try:
+            result = ExcelHandler.prepare_workbook(self.file_path, self.header_mapping, self._report_progress)
+            if result is None or self.isInterruptionRequested():
+                self.cancelled.emit()
+                return
+
+            self.build_indexes(result)
+            if self.isInterruptionRequested():
+                self.cancelled.emit()
+                return
+
+            self.loaded.emit(result)
+
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def _report_progress(self, rows_read, total_rows):
+        """행을 읽는 중간에 호출됨 (False를 반환하면 읽기 중단)"""
+        self.progress.emit(rows_read, total_rows)
+        return not self.isInterruptionRequested()
+
+    def build_indexes(self, result):
+        """GUI 스레드에서는 교체만 하도록 검색/채널/상품 색인과 지원자 묶음을 미리 생성"""
+        original_df = result['original_df']
+        normalized_df = result['normalized_df']
+
+        result['identity_clusters'] = IdentityClusters.from_cluster_ids(normalized_df['cluster_id'].to_numpy())
+        result['search_index'] = SearchIndex(normalized_df)
+
+        # 신청채널(D열)을 채널 체크박스 기준 비트마스크로 변환
+        result['channel_index'] = None
+        if result['channel_column_idx'] >= 0:
+            result['channel_index'] = ChannelIndex(original_df.iloc[:, result['channel_column_idx']], self.channel_list)
+
+        # 희망상품 역색인 (복수 상품 셀은 쉼표로 분리)
+        result['product_index'] = None
+        if result['product_column_idx'] >= 0:
+            result['product_index'] = ProductIndex(original_df.iloc[:, result['product_column_idx']])
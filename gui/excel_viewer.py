@@ -1,23 +1,28 @@
 import sys
+import numpy as np
 import pandas as pd
 import re
 import json
 import os
 import webbrowser
-from PyQt5.QtWidgets import (QMainWindow, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QMainWindow, QTableView, 
                             QVBoxLayout, QWidget, QPushButton, QFileDialog, QLabel, 
                             QHBoxLayout, QMessageBox, QGridLayout, QTabWidget, QInputDialog, 
-                            QComboBox, QCheckBox)
+                            QComboBox, QCheckBox, QProgressDialog)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor
 import datetime
 
-from widgets import StatusButton, URLTableWidgetItem
-from handlers import ExcelHandler, FilterHandler
+from handlers import (ExcelHandler, FilterHandler, ProductIndex, ChannelIndex, SearchIndex, IdentityClusters,
+                      WorkState, StateJournal, StateBackups, SqliteStateStore)
 from gui.ui_components import UIComponents
 from gui.tab_manager import TabManager
 from gui.table_manager import TableManager
 from gui.filter_manager import FilterManager
+from gui.table_model import ApplicantTableModel, RowSubsetProxyModel
+from gui.excel_loader import ExcelLoadWorker
+from gui.excel_exporter import ExcelExportWorker
+from gui.state_saver import StateSaveWorker
 
 class ExcelViewer(QMainWindow):
     def __init__(self):
@@ -27,26 +32,29 @@ class ExcelViewer(QMainWindow):
         
         # 원본 데이터프레임 저장 변수
         self.original_df = None
-        self.filtered_df = None
+        self.visible_row_ids = None  # 데이터 탭에 표시할 행 ID 배열 (필터 결과)
+        self.display_columns = []    # 화면에 표시할 칼럼 목록 (로드 시 한 번 계산)
         self.excel_file_path = ""  # 현재 로드된 엑셀 파일 경로
+        self.workbook_fingerprint = None  # 현재 엑셀 파일 지문 (작업 상태 파일과 짝이 맞는지 확인)
+        self.load_worker = None      # 엑셀 로드 작업 스레드 (로드 중일 때만)
+        self.load_progress = None    # 엑셀 로드 진행률 대화상자
+        self.export_worker = None    # 현재 화면 엑셀 저장 작업 스레드 (저장 중일 때만)
         
-        # 상태 버튼 데이터 저장
-        self.row_status = {}  # {row_id: status}
+        # 행별 상태, 지정상품, 지정채널, 완료 전 상태 (행 ID와 정렬된 배열)
+        self.work_state = WorkState()
         
         # 연락처 인덱스 저장
         self.contact_column_idx = -1  # 연락처 컬럼 인덱스
         self.name_column_idx = -1     # 이름 컬럼 인덱스
         self.product_column_idx = -1  # 희망상품 칼럼 인덱스
         self.url_column_idx = -1      # URL 칼럼 인덱스
+        self.channel_column_idx = -1  # 신청채널 칼럼 인덱스
         
         # 연락처별 선정된 행 ID 저장
         self.contact_selection = {}  # {연락처: 선정된_행_ID}
         
-        # 완료 상태로 변경된 행들의 원래 상태 저장
-        self.original_status = {}  # {row_id: 원래_상태}
-        
-        # 연락처별 관련 행 ID 저장
-        self.contact_rows = {}  # {연락처: [row_id1, row_id2, ...]}
+        # 같은 지원자로 보이는 행 묶음 (전화번호, 카톡아이디, 계정 URL 중 하나라도 같으면 한 묶음)
+        self.identity_clusters = None
         
         # 상태에 따른 행 배경색
         self.row_colors = {
@@ -81,26 +89,49 @@ class ExcelViewer(QMainWindow):
         # 상품 목록 (콤보박스에 표시할 항목들)
         self.product_list = []  # '전체' 항목 제거
         
-        # 테이블 위젯 생성
-        self.table = QTableWidget()
+        # 희망상품 역색인 (상품명 -> 행 ID 배열, 로드 시 생성)
+        self.product_index = None
+        
+        # 신청채널 비트마스크 (로드 시 생성)
+        self.channel_index = None
+        
+        # 이름/연락처/URL 검색 색인 (로드 시 생성)
+        self.search_index = None
+        
+        # 검색/중복 확인용 정규화 칼럼 (숫자 전화번호, 표시용 전화번호, 정리된 URL, 소문자 아이디)
+        self.normalized_df = None
+        
+        # 모든 탭이 함께 쓰는 지원자 모델 (원본 데이터프레임을 지연 표시)
+        self.applicant_model = ApplicantTableModel(self, self)
+        
+        # 데이터 탭 테이블 뷰 생성 (공유 모델의 필터링된 행만 표시)
+        self.table = QTableView()
+        self.table.setModel(RowSubsetProxyModel(self.applicant_model, self.table))
         
         # 상태 메시지 업데이트를 위한 타이머
         self.status_timer = QTimer()
         self.status_timer.setSingleShot(True)
         self.status_timer.timeout.connect(self.clear_status_after_delay)
         
-        # 행별 지정상품 정보 저장 
-        self.assigned_products = {}  # {row_id: 지정상품명}
-        
-        # 행별 지정채널 정보 저장
-        self.assigned_channels = {}  # {row_id: 지정채널명}
+        # 검색어 입력이 잠시 멈추면 필터 적용 (입력할 때마다 다시 시작)
+        self.search_debounce_ms = 250
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.apply_filters)
         
         # 상태 저장 관련 변수
         self.last_save_path = ""
+        self.state_journal = None  # 마지막 전체 저장 파일에 바뀐 행만 덧붙이는 저널
+        self.state_store = None    # SQLite 파일로 저장/불러온 경우 그 저장소 (클릭마다 바로 기록)
         self.auto_save_interval = 5  # 분 단위
+        # 자동 저장은 상태 변경이 일정 수 쌓이거나 잠시 멈추면 작업 스레드에서 실행 (클릭할 때마다 다시 시작)
+        self.auto_save_idle_ms = 3000
+        self.auto_save_change_limit = 50
         self.auto_save_timer = QTimer(self)
+        self.auto_save_timer.setSingleShot(True)
         self.auto_save_timer.timeout.connect(self.auto_save)
-        self.auto_save_timer.start(30 * 1000)  # 30초를 밀리초로 변환
+        self.save_worker = None  # 자동 저장 작업 스레드 (저장 중일 때만)
+        self.pending_change_count = 0  # 마지막 자동 저장 이후 바뀐 행 수
         self.is_state_modified = False  # 상태가 수정되었는지 여부
         
         # UI 초기화 먼저 수행 (tab_widget 생성)
@@ -327,34 +358,113 @@ class ExcelViewer(QMainWindow):
     # 필터 관련 메서드들 (FilterManager로 위임)
     def apply_filters(self):
         """모든 필터를 적용하여 테이블 업데이트"""
+        # 대기 중인 입력 검색은 지금 적용하는 필터로 대체됨
+        self.search_timer.stop()
         self.filter_manager.apply_filters()
     
+    def on_contact_search_text_changed(self, text):
+        """검색어 입력 시 일정 시간 입력이 없으면 필터 적용 (이전 대기 검색은 취소)"""
+        if self.original_df is None:
+            return
+        self.search_timer.start(self.search_debounce_ms)
+    
     def reset_filter(self):
         """모든 필터 초기화"""
         self.filter_manager.reset_filter()
     
     # 엑셀 로드 관련 메서드
     def load_excel(self):
-        """엑셀 파일 로드 및 테이블에 표시"""
+        """엑셀 파일을 선택해 작업 스레드에서 불러오기 시작"""
+        if self.load_worker is not None and self.load_worker.isRunning():
+            return
+        
+        # 현재 화면을 엑셀로 저장하는 중에는 원본 데이터프레임을 바꾸지 않도록 새 파일을 불러오지 않음
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.warning(self, "불러오기 오류", "현재 화면을 저장하는 중입니다. 저장이 끝난 뒤 다시 시도하세요.")
+            return
+        
         file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls)")
         if not file_path:
             return
         
+        # 파일 읽기, 전처리, 색인 생성은 작업 스레드에서 수행 (창이 멈추지 않음)
+        self.load_worker = ExcelLoadWorker(file_path, self.header_mapping, list(self.channel_checkboxes), self)
+        self.load_worker.progress.connect(self.on_load_progress)
+        self.load_worker.loaded.connect(lambda result, path=file_path: self.on_excel_loaded(path, result))
+        self.load_worker.failed.connect(self.on_load_failed)
+        self.load_worker.cancelled.connect(self.on_load_cancelled)
+        self.load_worker.finished.connect(self.on_load_finished)
+        
+        # 진행률 대화상자 (읽은 행 수 표시, 취소 가능)
+        self.load_progress = QProgressDialog(f"'{os.path.basename(file_path)}' 불러오는 중...", "취소", 0, 0, self)
+        self.load_progress.setWindowTitle("엑셀 파일 로드")
+        self.load_progress.setWindowModality(Qt.WindowModal)
+        self.load_progress.setMinimumDuration(500)
+        self.load_progress.setAutoClose(False)
+        self.load_progress.setAutoReset(False)
+        self.load_progress.canceled.connect(self.load_worker.requestInterruption)
+        
+        self.load_btn.setEnabled(False)
+        self.status_label.setText(f"'{os.path.basename(file_path)}' 파일을 불러오는 중...")
+        self.load_worker.start()
+    
+    def on_load_progress(self, rows_read, total_rows):
+        """작업 스레드에서 읽은 행 수 표시"""
+        if self.load_progress is None:
+            return
+        self.load_progress.setMaximum(total_rows)
+        self.load_progress.setValue(rows_read)
+        if total_rows:
+            self.load_progress.setLabelText(f"엑셀 파일 불러오는 중... ({rows_read:,} / {total_rows:,}행)")
+        else:
+            self.load_progress.setLabelText(f"엑셀 파일 불러오는 중... ({rows_read:,}행)")
+    
+    def on_load_failed(self, message):
+        """엑셀 로드 실패"""
+        QMessageBox.critical(self, "오류", f"엑셀 파일 로드 중 오류 발생: {message}")
+        self.status_label.setText("엑셀 파일을 불러오지 못했습니다.")
+    
+    def on_load_cancelled(self):
+        """엑셀 로드 취소 (기존 데이터는 그대로 유지)"""
+        self.status_label.setText("엑셀 파일 불러오기를 취소했습니다.")
+    
+    def on_load_finished(self):
+        """작업 스레드 종료 후 정리"""
+        if self.load_progress is not None:
+            self.load_progress.close()
+            self.load_progress.deleteLater()
+            self.load_progress = None
+        if self.load_worker is not None:
+            self.load_worker.deleteLater()
+            self.load_worker = None
+        self.load_btn.setEnabled(True)
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 진행 중인 엑셀 로드 중단, 엑셀/상태 저장은 끝날 때까지 기다리고 남은 변경 저장"""
+        if self.load_worker is not None and self.load_worker.isRunning():
+            self.load_worker.requestInterruption()
+            self.load_worker.wait()
+        # 저장 중인 엑셀 파일과 작업 상태는 끝까지 쓰고, 자동 저장을 기다리던 변경도 저장
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.wait()
+        self.flush_auto_save()
+        self.set_state_store(None)
+        super().closeEvent(event)
+    
+    def on_excel_loaded(self, file_path, result):
+        """작업 스레드에서 준비한 데이터와 색인을 화면에 연결"""
         try:
-        # 엑셀 파일 로드
             self.excel_file_path = file_path
             
-            # ExcelHandler 클래스를 통해 엑셀 로드
-            result = ExcelHandler.load_excel_file(
-                file_path=file_path, 
-                parent=self, 
-                header_mapping=self.header_mapping
-            )
-            
             # 반환 값 타입에 따른 처리
+            self.normalized_df = None
+            self.workbook_fingerprint = None
             if isinstance(result, pd.DataFrame):
                 self.original_df = result
+                result = {}
             elif isinstance(result, dict):
+                self.normalized_df = result.get('normalized_df')
+                self.workbook_fingerprint = result.get('workbook_fingerprint')
                 # 딕셔너리 키 확인 및 처리
                 keys = list(result.keys())
                 if 'dataframe' in keys:
@@ -377,51 +487,80 @@ class ExcelViewer(QMainWindow):
                 self.status_label.setText("엑셀 파일이 비어있거나 로드할 수 없습니다.")
                 return
             
+            # 정규화 칼럼이 없으면 여기서 한 번 계산
+            if self.normalized_df is None:
+                self.normalized_df = ExcelHandler.normalize_columns(self.original_df)
+            
+            # 상태 배열을 새 데이터 행 수에 맞춤 (기존 상태는 유지)
+            self.work_state.ensure_size(len(self.original_df))
+            
             # 필요한 인덱스 찾기 (연락처, 이름, 상품, URL 등)
             self.find_important_indices()
             
-            # 연락처별 행 ID 저장
-            self.organize_contacts_by_row()
+            # 연락처별 행 ID 저장 (작업 스레드에서 만든 묶음이 있으면 그대로 사용)
+            self.identity_clusters = result.get('identity_clusters')
+            if self.identity_clusters is None:
+                self.organize_contacts_by_row()
             
-            # 선택된 열만 보여주기
-            columns_to_show = []
-            for col in self.original_df.columns[2:14]:  # C(인덱스 2)부터 N(인덱스 13)까지
-                col_idx = self.original_df.columns.get_loc(col)
-                # K열(인덱스 10)과 M열(인덱스 12)는 제외
-                if col_idx != 10 and col_idx != 12:
-                    columns_to_show.append(col)
+            # 이름/연락처/URL 검색 색인 (URL 정리, 숫자만 남긴 연락처 포함)
+            self.search_index = result.get('search_index')
+            if self.search_index is None:
+                self.search_index = SearchIndex(self.normalized_df)
             
-            self.filtered_df = self.original_df[columns_to_show]
+            # 신청채널(시트 D열) 칼럼 위치 (로드 시 계산, 데이터프레임만 받은 경우는 전체 시트 기준 D열)
+            self.channel_column_idx = result.get('channel_column_idx', 3)
+            if not 0 <= self.channel_column_idx < len(self.original_df.columns):
+                self.channel_column_idx = -1
+            
+            # 신청채널을 채널 체크박스 기준 비트마스크로 변환
+            if 'channel_index' in result:
+                self.channel_index = result['channel_index']
+            else:
+                self.channel_index = None
+                if self.channel_column_idx >= 0:
+                    self.channel_index = ChannelIndex(self.original_df.iloc[:, self.channel_column_idx],
+                                                      list(self.channel_checkboxes))
+            
+            # 선택된 열만 보여주기 (칼럼 목록은 로드 시 한 번만 계산, 로드한 칼럼이 이미 표시할 칼럼으로 골라져 있음)
+            self.display_columns = result.get('display_columns') or list(self.original_df.columns)
+            
+            # 처음에는 모든 행 표시
+            self.visible_row_ids = np.arange(len(self.original_df))
+            self.filter_manager.clear_row_filter()
+            self.filter_manager.clear_result_cache()
+            
+            # 공유 모델에 새 데이터 연결
+            self.applicant_model.set_columns(self.display_columns)
             
             # 테이블 업데이트
-            self.table_manager.update_table(self.filtered_df)
+            self.table_manager.update_table(self.visible_row_ids)
             
             # 상품 목록 추출 및 콤보박스 업데이트 부분
+            self.product_index = None
             if self.product_column_idx >= 0:
-                # 모든 상품 추출
-                product_column = self.original_df.columns[self.product_column_idx]
-                products = []
-                
-                # 각 행에서 상품 추출
-                for item in self.original_df[product_column].dropna():
-                    # 여러 상품이 포함된 경우 분리
-                    if ',' in item:
-                        products.extend([p.strip() for p in item.split(',')])
-                    else:
-                        products.append(item.strip())
+                # 상품별 행 ID 역색인 (복수 상품 셀은 쉼표로 분리)
+                self.product_index = result.get('product_index')
+                if self.product_index is None:
+                    product_column = self.original_df.columns[self.product_column_idx]
+                    self.product_index = ProductIndex(self.original_df[product_column])
                 
-                # 중복 제거 및 정렬
-                self.product_list = sorted(list(set(products)))
+                # 중복 제거 및 정렬된 상품 목록
+                self.product_list = self.product_index.products
                 
-                # 콤보박스 업데이트
+                # 콤보박스 업데이트 (상품별 신청 수 포함)
                 self.product_combo.clear()
                 for product in self.product_list:
-                    self.product_combo.addItem(product)
+                    self.tab_manager.update_combo_with_tab_name(product)
                 
                 # 상품 목록을 기반으로 탭 업데이트
                 self.update_tabs_from_products()
             
-            self.status_label.setText(f"'{os.path.basename(file_path)}' 파일을 불러왔습니다.")
+            message = f"'{os.path.basename(file_path)}' 파일을 불러왔습니다."
+            memory_usage = result.get('memory_usage')
+            if memory_usage:
+                before, after = memory_usage
+                message += f" (메모리 {before / 1024 / 1024:.1f}MB → {after / 1024 / 1024:.1f}MB)"
+            self.status_label.setText(message)
             
         except Exception as e:
             self.status_label.setText(f"엑셀 로드 중 오류: {str(e)}")
@@ -448,19 +587,16 @@ class ExcelViewer(QMainWindow):
                 self.url_column_idx = i
     
     def organize_contacts_by_row(self):
-        """연락처별 행 ID 저장"""
-        if self.contact_column_idx == -1:
+        """전화번호, 카톡아이디, 계정 URL이 겹치는 행을 같은 지원자로 묶기"""
+        if self.original_df is None or self.normalized_df is None:
+            self.identity_clusters = None
             return
         
-        self.contact_rows = {}
-        
-        for row_id, row in self.original_df.iterrows():
-            contact = row.iloc[self.contact_column_idx]
-            if pd.notna(contact):
-                contact = str(contact).strip()
-                if contact not in self.contact_rows:
-                    self.contact_rows[contact] = []
-                self.contact_rows[contact].append(row_id)
+        # 로드 단계(또는 캐시)에서 계산한 묶음 번호가 있으면 그대로 사용
+        if 'cluster_id' in self.normalized_df:
+            self.identity_clusters = IdentityClusters.from_cluster_ids(self.normalized_df['cluster_id'].to_numpy())
+        else:
+            self.identity_clusters = IdentityClusters.from_normalized(self.normalized_df)
     
     # 저장 및 불러오기 관련 메서드
     def save_current_view(self):
@@ -469,7 +605,7 @@ class ExcelViewer(QMainWindow):
         current_tab_index = self.tab_widget.currentIndex()
         
         # 현재 탭이 선택되지 않았거나 데이터가 없는 경우
-        if current_tab_index < 0 or self.filtered_df is None or len(self.filtered_df) == 0:
+        if current_tab_index < 0 or self.visible_row_ids is None or len(self.visible_row_ids) == 0:
             QMessageBox.warning(self, "저장 오류", "저장할 데이터가 없습니다.")
             return
         
@@ -486,7 +622,7 @@ class ExcelViewer(QMainWindow):
         current_table = None
         
         for child in current_tab.children():
-            if isinstance(child, QTableWidget):
+            if isinstance(child, QTableView):
                 current_table = child
                 break
         
@@ -505,182 +641,140 @@ class ExcelViewer(QMainWindow):
         if not file_path.endswith('.xlsx'):
             file_path += '.xlsx'
         
-        try:
-            # 현재 탭의 테이블 데이터를 데이터프레임으로 변환
-            df_to_save = self.table_to_dataframe(current_table)
-            
-            # 데이터프레임이 비어있는 경우
-            if df_to_save is None or df_to_save.empty:
-                QMessageBox.warning(self, "저장 오류", "저장할 데이터가 없습니다.")
-                return
-            
-            # 엑셀 파일로 저장
-            df_to_save.to_excel(file_path, index=False)
-            
-            self.status_label.setText(f"현재 화면이 '{file_path}'에 저장되었습니다.")
-        except Exception as e:
-            QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류가 발생했습니다: {str(e)}")
-
-    def table_to_dataframe(self, table):
-        """테이블 위젯의 데이터를 데이터프레임으로 변환"""
-        # 행과 열 수 가져오기
-        rows = table.rowCount()
-        cols = table.columnCount()
-        
-        if rows == 0 or cols == 0:
-            return None
-        
-        # 헤더 가져오기
-        headers = []
-        for col in range(cols):
-            header_item = table.horizontalHeaderItem(col)
-            if header_item:
-                headers.append(header_item.text())
-            else:
-                headers.append(f"Column {col}")
-        
-        # 데이터 수집
-        data = []
-        for row in range(rows):
-            row_data = []
-            for col in range(cols):
-                # 상태 버튼 열은 건너뛰기 (첫 번째 열)
-                if col == 0:
-                    # 상태 버튼에서 상태값 가져오기
-                    widget = table.cellWidget(row, col)
-                    if hasattr(widget, 'get_status'):
-                        status_value = widget.get_status()
-                        status_text = ["미정", "선정", "대기", "제외", "완료"][status_value]
-                        row_data.append(status_text)
-                    else:
-                        row_data.append("")
-                    continue
-                
-                # 일반 셀은 텍스트 가져오기
-                item = table.item(row, col)
-                if item:
-                    row_data.append(item.text())
-                else:
-                    row_data.append("")
-            
-            data.append(row_data)
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.warning(self, "저장 오류", "이전 저장이 아직 진행 중입니다.")
+            return
         
-        # 데이터프레임 생성
-        return pd.DataFrame(data, columns=headers)
-
-    def save_work_state(self, auto_save=False):
-        """현재 작업 상태를 JSON 파일로 저장"""
-        # 수정된 내용이 없으면 저장 안함 (자동 저장인 경우)
-        if auto_save and not self.is_state_modified:
+        # 현재 탭의 행 ID와 상태만 복사해 두고 작업 스레드에서 원본 데이터프레임을 CHUNK_SIZE 행씩 읽어 저장
+        proxy_model = current_table.model()
+        if proxy_model.rowCount() == 0 or proxy_model.columnCount() == 0:
+            QMessageBox.warning(self, "저장 오류", "저장할 데이터가 없습니다.")
             return
         
+        row_ids = proxy_model.row_ids().copy()
+        headers = [proxy_model.headerData(col, Qt.Horizontal) for col in range(proxy_model.columnCount())]
+        self.export_worker = ExcelExportWorker(
+            file_path, self.original_df, headers, self.applicant_model.column_positions(),
+            row_ids, self.work_state.snapshot_rows(row_ids), self)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.saved.connect(self.on_export_saved)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.export_worker.finished.connect(self.on_export_finished)
+        
+        self.save_btn.setEnabled(False)
+        self.status_label.setText(f"'{os.path.basename(file_path)}' 저장 중...")
+        self.export_worker.start()
+    
+    def on_export_progress(self, rows_written, total_rows):
+        """엑셀 저장 진행 상황 표시"""
+        self.status_label.setText(f"엑셀 저장 중... ({rows_written:,} / {total_rows:,}행)")
+    
+    def on_export_saved(self, file_path):
+        self.status_label.setText(f"현재 화면이 '{file_path}'에 저장되었습니다.")
+    
+    def on_export_failed(self, message):
+        QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류가 발생했습니다: {message}")
+    
+    def on_export_finished(self):
+        if self.export_worker is not None:
+            self.export_worker.deleteLater()
+            self.export_worker = None
+        self.save_btn.setEnabled(True)
+
+    def save_work_state(self):
+        """현재 작업 상태를 스냅샷(.state), JSON 또는 SQLite 파일로 저장"""
         # 이전에 저장된 경로가 있으면 그 경로를 기본 경로로 설정
         default_path = self.last_save_path if self.last_save_path else ""
         
-        # 자동 저장이 아닌 경우에만 파일 대화상자 표시
-        if not auto_save:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "상태 저장", default_path, "JSON Files (*.json)")
-            if not file_path:
-                return
-        else:
-            # 자동 저장인 경우 마지막 저장 경로 사용
-            if not self.last_save_path:
-                # 자동 저장 경로가 없는 경우 현재 디렉토리에 자동 저장
-                file_path = "autosave_state.json"
-            else:
-                file_path = self.last_save_path
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "상태 저장", default_path, "State Files (*.state);;JSON Files (*.json);;SQLite Files (*.db)")
+        if not file_path:
+            return
         
         # 확장자 확인 및 추가
-        if not file_path.endswith('.json'):
-            file_path += '.json'
+        if not file_path.endswith(('.state', '.json', '.db')):
+            if 'SQLite' in selected_filter:
+                file_path += '.db'
+            elif 'JSON' in selected_filter:
+                file_path += '.json'
+            else:
+                file_path += '.state'
         
-        # 백업 파일 생성 (이전 파일이 있는 경우)
-        if os.path.exists(file_path):
-            # 타임스탬프 추가
-            timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-            
-            # 백업 폴더 경로 설정
-            backup_dir = os.path.join(os.path.dirname(file_path), "bak")
-            
-            # 백업 폴더가 없으면 생성
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
-            
-            # 백업 파일 경로 설정
-            backup_path = os.path.join(backup_dir, f"{os.path.basename(file_path)}.{timestamp}.bak")
-            
-            try:
-                import shutil
-                shutil.copy2(file_path, backup_path)
-            except Exception:
-                pass  # 백업 실패해도 계속 진행
-        
-        # 저장할 데이터 구성
-        state_data = {
-            'row_status': self.row_status,
-            'assigned_products': self.assigned_products,
-            'assigned_channels': self.assigned_channels,  # 지정채널 정보 추가
-            'version': '1.1'  # 버전 정보 추가
-        }
+        # 진행 중인 자동 저장이 같은 저널 파일을 쓰고 있을 수 있으므로 끝날 때까지 기다림
+        self.wait_for_auto_save()
         
         try:
-            # 정수 키를 문자열로 변환 (JSON은 키로 문자열만 허용)
-            row_status_str = {str(k): v for k, v in self.row_status.items()}
-            assigned_products_str = {str(k): v for k, v in self.assigned_products.items()}
-            assigned_channels_str = {str(k): v for k, v in self.assigned_channels.items()}
-            
-            state_data['row_status'] = row_status_str
-            state_data['assigned_products'] = assigned_products_str
-            state_data['assigned_channels'] = assigned_channels_str
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, ensure_ascii=False, indent=2)
+            if file_path.endswith('.db'):
+                # SQLite 파일에 전체 상태를 쓰고 이후 변경은 클릭마다 바로 기록
+                store = SqliteStateStore(file_path)
+                try:
+                    store.write_all(self.work_state)
+                except Exception:
+                    store.close()
+                    raise
+                self.state_journal = None
+                self.set_state_store(store)
+            else:
+                # 백업 파일 생성 (이전 파일이 있는 경우)
+                StateBackups.backup(file_path)
+                
+                # 전체 상태를 스냅샷으로 저장하고 이후 변경은 이 파일의 저널에 덧붙임
+                self.state_journal = StateJournal(file_path, fingerprint=self.workbook_fingerprint)
+                self.state_journal.compact(self.work_state)
+                self.set_state_store(None)
             
             # 저장 경로 기억
             self.last_save_path = file_path
             
             # 상태 변경 플래그 초기화
             self.is_state_modified = False
+            self.pending_change_count = 0
+            self.auto_save_timer.stop()
             
-            if not auto_save:
-                self.status_label.setText(f"작업 상태가 '{file_path}'에 저장되었습니다.")
-            else:
-                self.status_label.setText(f"작업 상태가 자동 저장되었습니다: {file_path}")
+            self.status_label.setText(f"작업 상태가 '{file_path}'에 저장되었습니다.")
         except Exception as e:
-            if not auto_save:
-                QMessageBox.critical(self, "저장 오류", f"상태 저장 중 오류가 발생했습니다: {str(e)}")
+            self.state_journal = None
+            QMessageBox.critical(self, "저장 오류", f"상태 저장 중 오류가 발생했습니다: {str(e)}")
 
     def load_work_state(self):
-        """저장된 작업 상태를 JSON 파일에서 불러오기"""
+        """저장된 작업 상태를 스냅샷(.state), JSON 또는 SQLite 파일에서 불러오기"""
         # 이전에 저장된 경로가 있으면 그 경로를 기본 경로로 설정
         default_path = self.last_save_path if self.last_save_path else ""
         
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "상태 불러오기", default_path, "JSON Files (*.json)")
+            self, "상태 불러오기", default_path, "State Files (*.state *.json *.db);;JSON Files (*.json);;SQLite Files (*.db)")
         if not file_path:
             return
         
+        # 자동 저장 중인 파일을 읽을 수 있으므로 끝날 때까지 기다림
+        self.wait_for_auto_save()
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
-            
-            # 버전 확인
-            version = state_data.get('version', '1.0')
-            
-            # 데이터 불러오기
-            row_status_str = state_data.get('row_status', {})
-            assigned_products_str = state_data.get('assigned_products', {})
-            assigned_channels_str = state_data.get('assigned_channels', {})
-            
-            # 문자열 키를 정수로 변환
-            self.row_status = {int(k): v for k, v in row_status_str.items()}
-            self.assigned_products = {int(k): v for k, v in assigned_products_str.items()}
-            self.assigned_channels = {int(k): v for k, v in assigned_channels_str.items()}
+            row_count = len(self.original_df) if self.original_df is not None else 0
+            if file_path.endswith('.db'):
+                # SQLite 파일은 쿼리 하나로 읽고 이후 변경은 클릭마다 바로 기록
+                store = SqliteStateStore(file_path)
+                try:
+                    self.work_state = store.load(row_count)
+                except Exception:
+                    store.close()
+                    raise
+                self.state_journal = None
+                self.set_state_store(store)
+            else:
+                # 스냅샷을 읽고 저널에 남은 변경을 이어서 재생
+                work_state, journal = StateJournal.load(file_path, row_count)
+                
+                # 다른 엑셀 파일에서 저장한 상태면 확인 후 불러옴
+                if not self.confirm_workbook_fingerprint(journal.fingerprint):
+                    return
+                self.work_state, self.state_journal = work_state, journal
+                self.set_state_store(None)
+            self.filter_manager.invalidate_status_results()
             
             # 테이블 업데이트
-            if self.filtered_df is not None:
-                self.table_manager.update_table(self.filtered_df)
+            if self.visible_row_ids is not None:
+                self.table_manager.update_table(self.visible_row_ids)
                 
                 # 각 탭의 테이블도 업데이트
                 self.update_all_tabs()
@@ -693,29 +787,137 @@ class ExcelViewer(QMainWindow):
             
             # 상태 변경 플래그 초기화
             self.is_state_modified = False
+            self.pending_change_count = 0
+            self.auto_save_timer.stop()
             
             self.status_label.setText(f"작업 상태가 '{file_path}'에서 불러와졌습니다.")
         except Exception as e:
             QMessageBox.critical(self, "불러오기 오류", f"상태 불러오기 중 오류가 발생했습니다: {str(e)}")
 
+    def on_state_changed(self, change_count):
+        """행 상태가 바뀔 때 호출 (변경이 쌓이면 바로, 아니면 입력이 잠시 멈춘 뒤 자동 저장)"""
+        # SQLite 파일로 작업 중이면 바뀐 행을 바로 한 트랜잭션으로 기록
+        if self.state_store is not None:
+            try:
+                self.state_store.write_changes(self.work_state)
+                return
+            except Exception as e:
+                # 기록에 실패하면 JSON 자동 저장으로 돌아감
+                self.set_state_store(None)
+                self.status_label.setText(f"상태 저장 중 오류가 발생했습니다: {str(e)}")
+        
+        self.is_state_modified = True
+        self.pending_change_count += change_count
+        if self.pending_change_count >= self.auto_save_change_limit:
+            self.auto_save()
+        else:
+            self.auto_save_timer.start(self.auto_save_idle_ms)
+
     def auto_save(self):
-        """자동 저장 실행"""
+        """자동 저장 실행 (상태 사본을 떠서 작업 스레드에서 저장)"""
+        # 이전 자동 저장이 진행 중이면 끝난 뒤 다시 확인
+        if self.save_worker is not None:
+            return
+        
+        job = self.take_auto_save_job()
+        if job is None:
+            return
+        
+        self.save_worker = StateSaveWorker(*job, parent=self)
+        self.save_worker.saved.connect(self.on_auto_save_saved)
+        self.save_worker.failed.connect(self.on_auto_save_failed)
+        self.save_worker.finished.connect(self.on_auto_save_finished)
+        self.save_worker.start()
+    
+    def take_auto_save_job(self):
+        """자동 저장할 변경이 있으면 (저널, 상태 사본, 저널 기록)을 만들고 변경 플래그 초기화 (없으면 None)"""
         # 등록된 상태가 있는 경우에만 자동 저장
-        if self.row_status and self.is_state_modified:
-            # 불러온 엑셀 파일명에 "_중간저장" 추가
-            if self.excel_file_path:
-                base_name = os.path.splitext(os.path.basename(self.excel_file_path))[0]
-                auto_save_path = os.path.join(os.path.dirname(self.excel_file_path), f"{base_name}_중간저장.json")
-            else:
-                auto_save_path = "autosave_state.json"
-            
-            # 자동 저장 경로 설정
-            self.last_save_path = auto_save_path
-            self.save_work_state(auto_save=True)
-            
-            # 자동 저장 시간 업데이트
-            current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.last_auto_save_label.setText(f"마지막 자동 저장: {current_time}")
+        if not (self.work_state.has_records() and self.is_state_modified):
+            return None
+        
+        # 불러온 엑셀 파일명에 "_중간저장" 추가
+        if self.excel_file_path:
+            base_name = os.path.splitext(os.path.basename(self.excel_file_path))[0]
+            auto_save_path = os.path.join(os.path.dirname(self.excel_file_path), f"{base_name}_중간저장.state")
+        else:
+            auto_save_path = "autosave_state.state"
+        
+        # 자동 저장 경로 설정
+        self.last_save_path = auto_save_path
+        
+        journal = self.state_journal
+        if journal is not None and journal.snapshot_path == auto_save_path:
+            # 같은 파일에 전체 저장한 적이 있으면 바뀐 행만 저널에 덧붙임
+            records = StateJournal.take_records(self.work_state)
+        else:
+            # 처음 저장하는 파일이면 전체 스냅샷을 씀
+            journal = StateJournal(auto_save_path, fingerprint=self.workbook_fingerprint)
+            records = None
+            self.work_state.take_changes()
+            self.state_journal = journal
+        
+        self.is_state_modified = False
+        self.pending_change_count = 0
+        self.auto_save_timer.stop()
+        return journal, self.work_state.copy(), records
+    
+    def flush_auto_save(self):
+        """창을 닫기 전 자동 저장을 기다리던 변경을 GUI 스레드에서 바로 저장"""
+        self.auto_save_timer.stop()
+        self.wait_for_auto_save()
+        
+        job = self.take_auto_save_job()
+        if job is None:
+            return
+        try:
+            StateSaveWorker.save(*job)
+        except Exception as e:
+            QMessageBox.warning(self, "자동 저장 오류", f"종료 전 작업 상태 저장 중 오류가 발생했습니다: {str(e)}")
+    
+    def on_auto_save_saved(self, file_path):
+        self.status_label.setText(f"작업 상태가 자동 저장되었습니다: {file_path}")
+        
+        # 자동 저장 시간 업데이트
+        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.last_auto_save_label.setText(f"마지막 자동 저장: {current_time}")
+    
+    def on_auto_save_failed(self, message):
+        """자동 저장 실패 (다음 자동 저장 때 전체를 다시 저장)"""
+        self.state_journal = None
+        self.is_state_modified = True
+        self.status_label.setText(f"자동 저장 중 오류가 발생했습니다: {message}")
+    
+    def on_auto_save_finished(self):
+        if self.save_worker is not None:
+            self.save_worker.deleteLater()
+            self.save_worker = None
+        # 저장하는 동안 바뀐 상태가 있으면 다시 예약
+        if self.is_state_modified:
+            self.auto_save_timer.start(self.auto_save_idle_ms)
+    
+    def confirm_workbook_fingerprint(self, fingerprint):
+        """작업 상태 파일의 엑셀 파일 지문이 현재 엑셀 파일과 다르면 계속 불러올지 확인"""
+        if fingerprint is None or self.workbook_fingerprint is None:
+            return True
+        if fingerprint.get('sha256') == self.workbook_fingerprint.get('sha256'):
+            return True
+        
+        reply = QMessageBox.question(self, '작업 상태 불러오기 확인',
+                                     f"이 작업 상태는 다른 엑셀 파일('{fingerprint.get('name', '')}')에서 저장되었습니다.\n"
+                                     f"그래도 불러오시겠습니까?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        return reply == QMessageBox.Yes
+    
+    def set_state_store(self, store):
+        """SQLite 저장소 교체 (None이면 JSON 자동 저장으로 돌아감)"""
+        if self.state_store is not None and self.state_store is not store:
+            self.state_store.close()
+        self.state_store = store
+    
+    def wait_for_auto_save(self):
+        """진행 중인 자동 저장이 끝날 때까지 기다림"""
+        if self.save_worker is not None and self.save_worker.isRunning():
+            self.save_worker.wait()
 
     def update_all_tabs(self):
         """모든 탭의 테이블 업데이트"""
@@ -724,7 +926,7 @@ class ExcelViewer(QMainWindow):
             if tab_text != "+" and tab_text != "데이터":
                 tab = self.tab_widget.widget(i)
                 for child in tab.children():
-                    if isinstance(child, QTableWidget):
+                    if isinstance(child, QTableView):
                         self.update_tab_table(child, tab_text)
                         break
 
@@ -747,7 +949,7 @@ class ExcelViewer(QMainWindow):
             new_tab_layout.addWidget(new_tab_table)
             
             # 테이블 데이터 표시 (필터링된 데이터)
-            if self.filtered_df is not None:
+            if self.visible_row_ids is not None:
                 self.update_tab_table(new_tab_table, product)
             
             self.tab_widget.addTab(new_tab, product)
@@ -762,65 +964,36 @@ class ExcelViewer(QMainWindow):
         self.tab_manager.update_tab_combo()
 
     def update_tab_table(self, table, product_name):
-        """탭의 테이블 데이터 업데이트"""
+        """탭의 테이블에 표시할 행 업데이트 (데이터프레임 복사 없이 행 ID만 계산)"""
         # '데이터' 탭이 아닌 경우에만 추가 필터링 적용
-        if product_name != "데이터" and self.filtered_df is not None and self.product_column_idx >= 0:
-            # 1. 원본 데이터로부터 시작
-            df = self.original_df.copy()
+        if product_name != "데이터" and self.visible_row_ids is not None and self.product_column_idx >= 0:
+            # 1. 원본 데이터 기준 마스크 (복사하지 않음)
+            df = self.original_df
+            mask = pd.Series(True, index=df.index)
             
             # 2. 검색 필터 적용 (이름/연락처/URL 검색)
             contact_search_text = self.contact_search_input.text().strip().lower()
             if contact_search_text:
-                # 이름, 연락처, URL 칼럼에서 검색어 포함 여부 확인
-                contact_mask = False
-                
-                # 연락처 칼럼이 있는 경우
-                if self.contact_column_idx >= 0:
-                    contact_mask = contact_mask | df.iloc[:, self.contact_column_idx].astype(str).str.contains(
-                        contact_search_text, case=False, na=False)
-                
-                # 이름 칼럼이 있는 경우
-                if self.name_column_idx >= 0:
-                    contact_mask = contact_mask | df.iloc[:, self.name_column_idx].astype(str).str.contains(
-                        contact_search_text, case=False, na=False)
-                
-                # URL 칼럼이 있는 경우
-                if self.url_column_idx >= 0:
-                    contact_mask = contact_mask | df.iloc[:, self.url_column_idx].astype(str).str.contains(
-                        contact_search_text, case=False, na=False)
-                
-                df = df[contact_mask]
+                # 이름, 연락처, URL 칼럼에서 검색어 포함 여부 확인 (검색 색인 사용)
+                mask = mask & self.search_index.match_mask(contact_search_text)
             
-            # 3. 상품명 필터 적용 (특정 탭의 상품만 표시)
-            product_col_name = self.original_df.columns[self.product_column_idx]
-            product_mask = df[product_col_name].str.contains(
-                product_name, case=False, na=False, regex=False)
-            df = df[product_mask]
+            # 3. 상품명 필터 적용 (특정 탭의 상품만 표시, 상품 역색인 사용)
+            product_mask = self.product_index.mask_for(self.product_index.rows_containing(product_name))
+            mask = mask.to_numpy() & product_mask
             
-            # 4. 상태 필터 (선정 상태만)
-            status_filtered_rows = []
-            for idx in df.index:
-                status = self.row_status.get(idx, 0)
-                # 상태가 선정(1)이고 지정상품 셀이 탭의 이름과 같은 경우
-                if status == 1 and self.assigned_products.get(idx) == product_name:
-                    status_filtered_rows.append(idx)
-            
-            if status_filtered_rows:
-                tab_filtered_df = self.original_df.loc[status_filtered_rows, self.filtered_df.columns]
-            else:
-                # 일치하는 데이터가 없으면 빈 데이터프레임 생성
-                tab_filtered_df = self.filtered_df.head(0)  # 빈 데이터프레임이지만 열 구조 유지
+            # 4. 상태 필터 (선정 상태이고 지정상품 셀이 탭의 이름과 같은 행만)
+            tab_row_ids = self.work_state.product_rows(product_name, mask)
             
-            # 테이블 위젯 업데이트
-            self.table_manager.update_table_widget(table, tab_filtered_df)
+            # 테이블 뷰 업데이트
+            self.table_manager.update_table_widget(table, tab_row_ids)
         else:
             # 데이터 탭은 기존 필터링된 데이터 표시 (모든 필터 적용)
-            self.table_manager.update_table_widget(table, self.filtered_df)
+            self.table_manager.update_table_widget(table, self.visible_row_ids)
 
     def on_tab_changed(self, index):
         """탭 변경 시 호출되는 메서드"""
         # 필터링된 데이터가 없으면 리턴
-        if self.filtered_df is None:
+        if self.visible_row_ids is None:
             return
         
         # 현재 탭 이름 가져오기
@@ -838,7 +1011,7 @@ class ExcelViewer(QMainWindow):
         
         # 탭에서 테이블 위젯 찾기
         for child in current_tab.children():
-            if isinstance(child, QTableWidget):
+            if isinstance(child, QTableView):
                 # 해당 탭의 테이블 업데이트
                 self.update_tab_table(child, tab_text)
                 
@@ -859,7 +1032,7 @@ class ExcelViewer(QMainWindow):
 
     def update_tab_statistics(self, tab_name):
         """특정 탭의 상태 통계 업데이트"""
-        if not self.row_status or self.filtered_df is None or self.product_column_idx < 0:
+        if not self.work_state.has_records() or self.visible_row_ids is None or self.product_column_idx < 0:
             self.stats_label.setText(f"탭 '{tab_name}' 통계 ▶ 데이터 없음")
             return
         
@@ -869,33 +1042,29 @@ class ExcelViewer(QMainWindow):
         current_table = None
         
         for child in current_tab.children():
-            if isinstance(child, QTableWidget):
+            if isinstance(child, QTableView):
                 current_table = child
                 break
         
-        if current_table is None or current_table.rowCount() == 0:
+        if current_table is None or current_table.model().rowCount() == 0:
             self.stats_label.setText(f"탭 '{tab_name}' 통계 ▶ 데이터 없음")
             return
         
-        # 상태별 카운트
-        status_count = {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}
+        model = current_table.model()
         
-        # 지정채널별 카운트 
-        channel_count = {}
+        row_ids = model.row_ids()
         
-        # 현재 화면에 표시된 데이터에 대한 상태 및 채널 카운트
-        for row in range(current_table.rowCount()):
-            # 상태 버튼에서 상태 가져오기
-            status_btn = current_table.cellWidget(row, 0)
-            if isinstance(status_btn, StatusButton):
-                current_status = status_btn.get_status()
-                status_count[current_status] += 1
-                
-                # 지정채널 카운트
-                channel_item = current_table.item(row, 2)  # 지정채널 열 인덱스
-                if channel_item:
-                    channel_name = channel_item.text()
-                    channel_count[channel_name] = channel_count.get(channel_name, 0) + 1
+        # 현재 화면에 표시된 데이터에 대한 상태별 카운트
+        status_count = self.work_state.status_counts(row_ids)
+        
+        # 지정채널별 카운트 (선정 상태가 아니거나 지정채널이 없으면 빈 문자열)
+        channel_count = {}
+        statuses = self.work_state.status[row_ids]
+        channel_codes = np.where(statuses == 1, self.work_state.channel_codes[row_ids], -1)
+        codes, counts = np.unique(channel_codes, return_counts=True)
+        for code, count in zip(codes, counts):
+            channel_name = self.work_state.channel_names[code] if code >= 0 else ""
+            channel_count[channel_name] = int(count)
         
         # 통계 텍스트 생성
         stats_text = f"탭 '{tab_name}' 통계 ▶ "
@@ -907,7 +1076,7 @@ class ExcelViewer(QMainWindow):
                 status_texts.append(f"{status_names[status]}: {count}명")
         
         # 현재 화면의 총 인원 추가
-        visible_rows = current_table.rowCount()
+        visible_rows = model.rowCount()
         status_texts.append(f"현재 화면: {visible_rows}명")
         
         stats_text += ", ".join(status_texts)
@@ -1000,20 +1169,15 @@ class ExcelViewer(QMainWindow):
 
     def update_status_statistics(self):
         """상태 통계 업데이트"""
-        if not self.row_status:
+        if not self.work_state.has_records():
             self.stats_label.setText("상태 통계 ▶ 데이터 없음")
             return
         
-        # 상태별 카운트
-        status_count = {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}
-        for status in self.row_status.values():
-            status_count[status] = status_count.get(status, 0) + 1
+        # 상태별 카운트 (상태가 지정된 행 기준)
+        status_count = self.work_state.status_counts()
         
         # 지정채널별 카운트 (선정 상태인 것만)
-        channel_count = {}
-        for row_id, channel in self.assigned_channels.items():
-            if self.row_status.get(row_id, 0) == 1:  # 선정된 것만 카운트
-                channel_count[channel] = channel_count.get(channel, 0) + 1
+        channel_count = self.work_state.selected_channel_counts()
         
         # 통계 텍스트 생성
         stats_text = "상태 통계 ▶ "
@@ -1026,8 +1190,8 @@ class ExcelViewer(QMainWindow):
         
         # 현재 필터링된 데이터의 행 수 추가
         visible_rows = 0
-        if self.filtered_df is not None:
-            visible_rows = len(self.filtered_df)
+        if self.visible_row_ids is not None:
+            visible_rows = len(self.visible_row_ids)
         status_texts.append(f"현재 화면: {visible_rows}명")
         
         stats_text += ", ".join(status_texts)
@@ -1044,7 +1208,7 @@ class ExcelViewer(QMainWindow):
 
     def open_urls_in_table(self):
         """현재 테이블에 표시된 URL을 선택된 상태에 따라 열기"""
-        if self.filtered_df is None or self.filtered_df.empty:
+        if self.visible_row_ids is None or len(self.visible_row_ids) == 0:
             QMessageBox.warning(self, "URL 열기 오류", "표시된 데이터가 없습니다.")
             return
         
@@ -1054,21 +1218,17 @@ class ExcelViewer(QMainWindow):
         current_table = None
         
         for child in current_tab.children():
-            if isinstance(child, QTableWidget):
+            if isinstance(child, QTableView):
                 current_table = child
                 break
         
-        if current_table is None or current_table.rowCount() == 0:
+        if current_table is None or current_table.model().rowCount() == 0:
             QMessageBox.warning(self, "URL 열기 오류", "선택한 탭에 데이터가 없습니다.")
             return
         
         # URL 열 인덱스 확인 (테이블 내에서의 인덱스)
-        url_table_idx = -1
-        for i, col in enumerate(self.filtered_df.columns):
-            col_str = str(col).lower()
-            if "url" in col_str or "계정 링크" in col or "블로그" in col:
-                url_table_idx = i + 3  # +3은 상태, 지정상품, 지정채널 칼럼 때문
-                break
+        model = current_table.model()
+        url_table_idx = model.url_column()
         
         if url_table_idx == -1:
             QMessageBox.warning(self, "URL 열기 오류", "URL 열을 찾을 수 없습니다.")
@@ -1081,22 +1241,18 @@ class ExcelViewer(QMainWindow):
         
         # 테이블의 모든 URL 수집
         urls = []
-        for row in range(current_table.rowCount()):
-            item = current_table.item(row, url_table_idx)
-            if item:
-                url_text = item.text().strip()
-                if url_text:
-                    # URL 형식 확인 및 수정
-                    url = url_text
-                    if not url.startswith(('http://', 'https://')):
-                        url = 'https://' + url
-                    
-                    # 상태에 따라 URL 추가
-                    status_btn = current_table.cellWidget(row, 0)  # 상태 버튼은 cellWidget으로 가져옴
-                    if isinstance(status_btn, StatusButton):
-                        current_status = status_btn.get_status()
-                        if selected_status_text == "전체" or current_status == selected_status:
-                            urls.append(url)
+        for row_id in model.row_ids():
+            url_text = model.display_text(row_id, url_table_idx).strip()
+            if url_text:
+                # URL 형식 확인 및 수정
+                url = url_text
+                if not url.startswith(('http://', 'https://')):
+                    url = 'https://' + url
+                
+                # 상태에 따라 URL 추가
+                current_status = self.work_state.status_of(row_id)
+                if selected_status_text == "전체" or current_status == selected_status:
+                    urls.append(url)
         
         if not urls:
             QMessageBox.warning(self, "URL 열기 오류", "선택한 탭에 해당 상태의 데이터가 없습니다.")
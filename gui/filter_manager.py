@@ -1,7 +1,9 @@
 import os
+from collections import OrderedDict
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QCheckBox, 
                             QComboBox, QHBoxLayout, QGroupBox)
-from handlers import FilterHandler
+from handlers import FilterHandler, FilterPredicate
+import numpy as np
 import pandas as pd
 
 class FilterManager:
@@ -15,6 +17,35 @@ class FilterManager:
             parent: ExcelViewer 클래스의 인스턴스
         """
         self.parent = parent
+        
+        # 데이터 탭에 적용 중인 필터 실행 계획 (행 단위 갱신 시 사용, None이면 필터 없음)
+        self.active_plan = None
+        
+        # 필터 조건별 결과 캐시 (최근에 쓴 조건부터 유지, 오래된 것부터 삭제)
+        self.result_cache = OrderedDict()  # {(상품, 단일상품, 검색어, 상태, 채널): (행 ID 배열, 실행 계획)}
+        self.result_cache_size = 32
+    
+    def clear_row_filter(self):
+        """행 단위 갱신용 필터 정보 초기화 (모든 행 표시)"""
+        self.active_plan = None
+    
+    def is_row_visible(self, row_id, currently_visible):
+        """상태가 바뀐 행이 데이터 탭에 표시되어야 하는지 확인"""
+        # 상태 필터가 없으면 행 구성은 바뀌지 않음
+        if self.active_plan is None or not self.active_plan.depends_on_status:
+            return currently_visible
+        
+        # 현재 실행 계획의 모든 조건을 이 행 하나에 대해 확인
+        return self.active_plan.accepts(row_id)
+    
+    def clear_result_cache(self):
+        """필터 결과 캐시 전체 삭제 (새 데이터를 불러온 경우)"""
+        self.result_cache.clear()
+    
+    def invalidate_status_results(self):
+        """상태 필터가 걸린 캐시 항목만 삭제 (행 상태가 바뀐 경우)"""
+        for key in [key for key in self.result_cache if key[3] is not None]:
+            del self.result_cache[key]
     
     def apply_filters(self):
         """현재 필터 설정에 따라 데이터 필터링"""
@@ -22,98 +53,46 @@ class FilterManager:
         if self.parent.original_df is None:
             return
         
-        # 필터링을 위한 마스크 생성 (모든 행 선택)
-        mask = pd.Series([True] * len(self.parent.original_df))
-        
-        # 선택된 상품에 따른 필터링
         selected_product = self.parent.product_combo.currentText()
-        # '전체'가 아닌 경우에만 필터링 적용
-        if selected_product and selected_product != "전체":
-            # 희망 상품 컬럼이 있는 경우에만 필터링 적용
-            if self.parent.product_column_idx >= 0:
-                product_col_name = self.parent.original_df.columns[self.parent.product_column_idx]
-                # 상품명이 포함된 행만 선택
-                product_mask = self.parent.original_df[product_col_name].str.contains(
-                    selected_product, case=False, na=False, regex=False)
-                mask = mask & product_mask
-        
-        # 2. 단일 상품 필터 적용
-        if self.parent.single_product_checkbox.isChecked() and selected_product:
-            try:
-                filtered_original = FilterHandler.apply_single_product_filter(self.parent.original_df)
-                
-                # '상품명' 열이 있는지 확인
-                if '상품명' in filtered_original.columns:
-                    mask = mask & (filtered_original['상품명'] == selected_product)
-                elif self.parent.product_column_idx >= 0:
-                    # '상품명' 열이 없으면 희망상품 컬럼을 대신 사용
-                    product_col_name = self.parent.original_df.columns[self.parent.product_column_idx]
-                    # 정확히 일치하는 상품만 필터링
-                    mask = mask & (self.parent.original_df[product_col_name] == selected_product)
-                else:
-                    self.parent.status_label.setText("단일 상품 필터링을 위한 '상품명' 열을 찾을 수 없습니다.")
-            except Exception as e:
-                self.parent.status_label.setText(f"단일 상품 필터 적용 중 오류: {str(e)}")
-        
-        # 3. 이름/연락처/URL 검색 필터 적용
+        single_product = self.parent.single_product_checkbox.isChecked()
         contact_search_text = self.parent.contact_search_input.text().strip()
-        if contact_search_text:
-            filtered_original = FilterHandler.apply_contact_search_filter(
-                self.parent.original_df, contact_search_text, 
-                self.parent.name_column_idx, self.parent.contact_column_idx, self.parent.url_column_idx
-            )
-            
-            # 인덱스 직접 비교 대신 불리언 마스크 생성
-            contact_mask = pd.Series(False, index=self.parent.original_df.index)
-            contact_mask[filtered_original.index] = True
-            mask = mask & contact_mask
-        
-        # 4. 상태별 필터 적용
-        selected_statuses = [status for status, checkbox in self.parent.status_checkboxes.items() 
-                          if checkbox.isChecked()]
-        
-        if len(selected_statuses) < 5:  # 5개 상태가 모두 선택되지 않은 경우
-            # 선택된 상태 값과 일치하는 행만 남김
-            status_mask = self.parent.original_df.index.to_series().apply(
-                lambda idx: self.parent.row_status.get(idx, 0) in selected_statuses
-            )
-            mask = mask & status_mask
-        
-        # 5. 채널 필터 적용
         selected_channels = [channel for channel, checkbox in self.parent.channel_checkboxes.items() 
                             if checkbox.isChecked()]
-        
-        if selected_channels and len(selected_channels) < len(self.parent.channel_list):
-            filtered_original = FilterHandler.apply_channel_filter(self.parent.original_df, selected_channels)
-            
-            # 인덱스 직접 비교 대신 불리언 마스크 생성
-            channel_mask = pd.Series(False, index=self.parent.original_df.index)
-            channel_mask[filtered_original.index] = True
-            mask = mask & channel_mask
+        selected_statuses = [status for status, checkbox in self.parent.status_checkboxes.items() 
+                          if checkbox.isChecked()]
         
         # 아무것도 선택되지 않았으면 경고
         if len(selected_channels) == 0:
             self.parent.status_label.setText("최소 하나의 채널을 선택해주세요.")
             return
         
-        if len(self.parent.original_df[mask]) == 0:
+        # 같은 조건의 결과가 캐시에 있으면 마스크 계산 생략
+        status_key = tuple(selected_statuses) if len(selected_statuses) < 5 else None
+        cache_key = (selected_product, single_product, contact_search_text, status_key, tuple(selected_channels))
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.result_cache.move_to_end(cache_key)
+        else:
+            cached = self.compute_filter_result(selected_product, single_product, contact_search_text,
+                                                selected_channels, selected_statuses)
+            self.result_cache[cache_key] = cached
+            if len(self.result_cache) > self.result_cache_size:
+                self.result_cache.popitem(last=False)
+        visible_row_ids, plan = cached
+        
+        if len(visible_row_ids) == 0:
             self.parent.status_label.setText("필터 조건에 맞는 데이터가 없습니다.")
             self.parent.update_status_statistics()  # 빈 결과도 통계 업데이트
             return
         
-        # C열부터 N열 선택 (K열, M열 제외)
-        columns_to_show = []
-        for col in self.parent.original_df.columns[2:14]:  # C(인덱스 2)부터 N(인덱스 13)까지
-            col_idx = self.parent.original_df.columns.get_loc(col)
-            # K열(인덱스 10)과 M열(인덱스 12)는 제외
-            if col_idx != 10 and col_idx != 12:
-                columns_to_show.append(col)
+        # 필터 결과는 행 ID 배열로만 보관 (칼럼 목록은 로드 시 계산된 것 사용)
+        self.parent.visible_row_ids = visible_row_ids
         
-        # 필터링된 데이터프레임 적용
-        self.parent.filtered_df = self.parent.original_df[mask][columns_to_show]
+        # 행 단위 갱신용 필터 정보 저장
+        self.active_plan = plan
         
         # 테이블 업데이트
-        self.parent.table_manager.update_table(self.parent.filtered_df)
+        self.parent.table_manager.update_table(self.parent.visible_row_ids)
         
         # 필터 상태 메시지 업데이트
         filter_msg = []
@@ -121,7 +100,7 @@ class FilterManager:
             filter_msg.append(f"상품검색: '{selected_product}'")
         if contact_search_text:
             filter_msg.append(f"이름/연락처/URL: '{contact_search_text}'")
-        if self.parent.single_product_checkbox.isChecked():
+        if single_product:
             filter_msg.append("단일 상품만")
 
         # 상태 필터 메시지 추가
@@ -138,9 +117,66 @@ class FilterManager:
         else:
             self.parent.status_label.setText("모든 데이터가 표시됩니다.")
         
+        # 상태 메시지에 마우스를 올리면 실행 계획과 조건별 소요 시간 표시
+        self.parent.status_label.setToolTip(plan.explain())
+        
         # 상태 메시지 업데이트를 위한 타이머 시작
         self.parent.status_timer.start(3000)  # 3초 후 업데이트
     
+    def compute_filter_result(self, selected_product, single_product, contact_search_text,
+                              selected_channels, selected_statuses):
+        """필터 조건에 맞는 (행 ID 배열, 실행 계획) 계산"""
+        df = self.parent.original_df
+        row_count = len(df)
+        predicates = []
+        
+        # 1. 선택된 상품에 따른 필터링 ('전체'가 아닌 경우에만, 상품 역색인 사용)
+        predicates.append(FilterHandler.product_predicate(self.parent.product_index, selected_product))
+        
+        # 2. 단일 상품 필터 적용
+        if single_product and selected_product:
+            try:
+                predicate = FilterHandler.single_product_predicate(df, self.parent.product_index, selected_product,
+                                                                   self.parent.product_column_idx)
+                if predicate is None:
+                    self.parent.status_label.setText("단일 상품 필터링을 위한 '상품명' 열을 찾을 수 없습니다.")
+                predicates.append(predicate)
+            except Exception as e:
+                self.parent.status_label.setText(f"단일 상품 필터 적용 중 오류: {str(e)}")
+        
+        # 3. 이름/연락처/URL 검색 필터 적용
+        if contact_search_text:
+            if self.parent.search_index is not None:
+                # 로드 시 만든 n-gram 색인으로 후보 행만 확인
+                predicates.append(FilterHandler.search_predicate(self.parent.search_index, contact_search_text))
+            else:
+                filtered_original = FilterHandler.apply_contact_search_filter(
+                    df, contact_search_text, 
+                    self.parent.name_column_idx, self.parent.contact_column_idx, self.parent.url_column_idx
+                )
+                predicates.append(FilterPredicate.from_rows("검색", filtered_original.index.to_numpy(), row_count))
+        
+        # 4. 채널 필터 적용
+        if selected_channels and len(selected_channels) < len(self.parent.channel_list):
+            channel_index = self.parent.channel_index
+            if channel_index is not None and channel_index.has_channels(selected_channels):
+                # 로드 시 만든 채널 비트마스크 사용
+                predicates.append(FilterHandler.channel_predicate(channel_index, selected_channels))
+            else:
+                filtered_original = FilterHandler.apply_channel_filter(df, selected_channels, self.parent.channel_column_idx)
+                predicates.append(FilterPredicate.from_rows("채널", filtered_original.index.to_numpy(), row_count))
+        
+        # 5. 상태별 필터 적용 (5개 상태가 모두 선택되지 않은 경우, 실행 시점의 상태 사용)
+        if len(selected_statuses) < 5:
+            work_state = self.parent.work_state
+            predicates.append(FilterHandler.status_predicate(
+                lambda: self.parent.work_state.statuses(row_count), selected_statuses,
+                work_state.status_totals(row_count)))
+        
+        # 예상 통과 행 수가 적은 조건부터 실행
+        plan = FilterHandler.build_plan(row_count, predicates)
+        return plan.execute(), plan
+    
     def reset_filter(self):
         """모든 필터 초기화"""
         if self.parent.original_df is None:
@@ -149,6 +185,7 @@ class FilterManager:
         # 검색어 필드 초기화
         self.parent.product_combo.setCurrentIndex(0)  # '전체'로 설정
         self.parent.contact_search_input.clear()  # 이름/연락처 검색 필드도 초기화
+        self.parent.search_timer.stop()  # 검색어 초기화로 예약된 검색은 취소
         
         # 단일 상품 체크박스 초기화
         self.parent.single_product_checkbox.setChecked(False)
@@ -161,18 +198,11 @@ class FilterManager:
         for checkbox in self.parent.channel_checkboxes.values():
             checkbox.setChecked(True)
         
-        # C열부터 N열 선택 (K열, M열 제외)
-        columns_to_show = []
-        for col in self.parent.original_df.columns[2:14]:  # C(인덱스 2)부터 N(인덱스 13)까지
-            col_idx = self.parent.original_df.columns.get_loc(col)
-            # K열(인덱스 10)과 M열(인덱스 12)는 제외
-            if col_idx != 10 and col_idx != 12:
-                columns_to_show.append(col)
-        
-        # 선택된 열만 포함하는 데이터프레임 생성
-        self.parent.filtered_df = self.parent.original_df[columns_to_show]
+        # 모든 행 표시
+        self.parent.visible_row_ids = np.arange(len(self.parent.original_df))
+        self.clear_row_filter()
         
         # 테이블 업데이트
-        self.parent.table_manager.update_table(self.parent.filtered_df)
+        self.parent.table_manager.update_table(self.parent.visible_row_ids)
         
         self.parent.status_label.setText("필터가 초기화되었습니다.") 
\ No newline at end of file
@@ -0,0 +1,45 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from handlers import StateBackups
+
+
+class StateSaveWorker(QThread):
+    """작업 상태 사본을 GUI 스레드 밖에서 저널 또는 스냅샷 파일로 저장하는 작업 스레드"""
+
+    # 저장한 스냅샷 파일 경로
+    saved = pyqtSignal(str)
+    # 오류 메시지
+    failed = pyqtSignal(str)
+
+    def __init__(self, journal, work_state, records=None, parent=None):
+        """
+        초기화
+
+        Args:
+            journal: 저장할 파일의 StateJournal
+            work_state: 저장 시점의 WorkState 사본 (WorkState.copy())
+            records: 저널에 덧붙일 기록 (StateJournal.take_records), None이면 스냅샷 전체를 새로 씀
+        """
+        super().__init__(parent)
+        self.journal = journal
+        self.work_state = work_state
+        self.records = records
+
+    def run(self):
+        try:
+            StateSaveWorker.save(self.journal, self.work_state, self.records)
+            self.saved.emit(self.journal.snapshot_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    @staticmethod
+    def save(journal, work_state, records=None):
+        """저널에 기록을 덧붙이거나 (records가 None이면) 백업 후 스냅샷 전체를 새로 씀
+
+        창을 닫을 때는 GUI 스레드에서 바로 호출
+        """
+        if records is None:
+            StateBackups.backup(journal.snapshot_path)
+            journal.compact(work_state)
+        else:
+            journal.append(records, work_state)
@@ -1,4 +1,5 @@
 import webbrowser
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QWidget, QInputDialog, QVBoxLayout
 
 class TabManager:
@@ -56,15 +57,15 @@ class TabManager:
             self.update_combo_with_tab_name(tab_name)
     
     def create_table_widget(self):
-        """테이블 위젯 생성 및 설정"""
-        from PyQt5.QtWidgets import QTableWidget
-        table = QTableWidget()
-        # 기본 테이블과 동일한 설정 적용
-        table.setColumnCount(self.parent.table.columnCount())
-        table.setRowCount(self.parent.table.rowCount())
+        """테이블 뷰 생성 및 설정"""
+        from PyQt5.QtWidgets import QTableView
+        from gui.table_model import RowSubsetProxyModel
+        table = QTableView()
+        # 공유 모델 위에 탭별 프록시만 생성
+        table.setModel(RowSubsetProxyModel(self.parent.applicant_model, table))
         
         # 테이블 이벤트 연결
-        table.cellClicked.connect(self.parent.table_manager.on_cell_clicked)
+        self.parent.table_manager.setup_view(table)
         
         return table
 
@@ -128,6 +129,13 @@ class TabManager:
         if self.parent.product_combo.findText(tab_name) < 0:
             # 없으면 추가
             self.parent.product_combo.addItem(tab_name)
+            
+            # 상품 역색인에 있는 상품이면 신청 수를 툴팁으로 표시
+            product_index = self.parent.product_index
+            if product_index is not None and tab_name in product_index.product_counts:
+                self.parent.product_combo.setItemData(
+                    self.parent.product_combo.count() - 1,
+                    f"신청 {product_index.product_counts[tab_name]}명", Qt.ToolTipRole)
 
     def update_tab_combo(self):
         """현재 탭 이름을 콤보박스에 업데이트"""
@@ -0,0 +1,272 @@
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+from widgets import StatusDelegate, STATUS_ROLE
+
+
+class ApplicantTableModel(QAbstractTableModel):
+    """원본 데이터프레임 전체를 필요한 셀만 문자열로 변환해 보여주는 공유 테이블 모델 (행 번호 = 행 ID)"""
+    
+    # 상태 칼럼 클릭으로 상태 변경이 요청되었을 때 (행 ID, 새 상태)
+    status_change_requested = pyqtSignal(object, int)
+    
+    # 상태, 지정상품, 지정채널 칼럼 수
+    EXTRA_COLUMNS = 3
+    EXTRA_HEADERS = ["상태", "지정상품", "지정채널"]
+    
+    def __init__(self, viewer, parent=None):
+        """
+        초기화
+        
+        Args:
+            viewer: ExcelViewer 클래스의 인스턴스 (원본 데이터와 상태 정보 보유)
+        """
+        super().__init__(parent)
+        self.viewer = viewer
+        self._row_count = 0       # 원본 데이터프레임 행 수
+        self._columns = []        # 표시할 원본 칼럼 이름
+        self._positions = []      # 표시할 원본 칼럼 위치
+        self._url_column = -1     # URL 칼럼의 테이블 인덱스
+        
+        # 자주 쓰는 색상/폰트 객체는 미리 만들어 둠
+        self._row_brushes = {status: QColor(color) for status, color in viewer.row_colors.items() if color}
+        self._url_color = QColor("blue")
+        self._url_font = QFont()
+        self._url_font.setUnderline(True)
+    
+    def set_columns(self, columns):
+        """원본 데이터프레임이 바뀌었을 때 표시할 칼럼 설정"""
+        self.beginResetModel()
+        df = self.viewer.original_df
+        if df is None or not columns:
+            self._row_count = 0
+            self._columns = []
+            self._positions = []
+            self._url_column = -1
+        else:
+            self._row_count = len(df)
+            self._columns = list(columns)
+            self._positions = df.columns.get_indexer(self._columns).tolist()
+            self._url_column = -1
+            for i, col in enumerate(self._columns):
+                col_str = str(col).lower()
+                if "url" in col_str or "계정 링크" in col_str or "블로그" in col_str:
+                    self._url_column = i + self.EXTRA_COLUMNS
+                    break
+        self.endResetModel()
+    
+    def refresh_rows(self, row_ids):
+        """지정한 행만 다시 그리기 (이 모델을 쓰는 모든 뷰에 반영됨)"""
+        last_col = self.columnCount() - 1
+        for row_id in row_ids:
+            self.dataChanged.emit(self.index(row_id, 0), self.index(row_id, last_col))
+    
+    def refresh_all(self):
+        """모든 셀 다시 그리기"""
+        if self._row_count:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(self._row_count - 1, self.columnCount() - 1))
+    
+    def columns(self):
+        """표시 중인 원본 칼럼 이름 목록"""
+        return self._columns
+    
+    def url_column(self):
+        """URL 칼럼의 테이블 인덱스 (없으면 -1)"""
+        return self._url_column
+    
+    def column_positions(self):
+        """표시 중인 칼럼의 원본 데이터프레임 칼럼 위치"""
+        return self._positions
+    
+    def status_of(self, row_id):
+        return self.viewer.work_state.status_of(row_id)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._row_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self._columns:
+            return 0
+        return len(self._columns) + self.EXTRA_COLUMNS
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row_id = index.row()
+        col = index.column()
+        status = self.status_of(row_id)
+        
+        if role == Qt.DisplayRole:
+            return self.display_text(row_id, col, status)
+        
+        if role == STATUS_ROLE:
+            return status
+        
+        if role == Qt.BackgroundRole and col > 0:
+            return self._row_brushes.get(status)
+        
+        if role == Qt.ForegroundRole and col == self._url_column:
+            return self._url_color
+        
+        if role == Qt.FontRole and col == self._url_column:
+            return self._url_font
+        
+        if role == Qt.ToolTipRole and col == self._url_column:
+            return f"클릭하여 열기: {self.display_text(row_id, col, status).strip()}"
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """상태 칼럼 값 변경 요청 (실제 상태 변경은 TableManager에서 처리)"""
+        if not index.isValid() or index.column() != 0 or role != Qt.EditRole:
+            return False
+        self.status_change_requested.emit(index.row(), int(value))
+        return True
+    
+    def display_text(self, row_id, col, status=None):
+        """셀에 표시할 문자열"""
+        if status is None:
+            status = self.status_of(row_id)
+        
+        if col == 0:
+            return StatusDelegate.STATUS_TEXTS.get(status, "")
+        if col == 1:
+            return self.viewer.work_state.assigned_product(row_id) if status == 1 else ""
+        if col == 2:
+            return self.viewer.work_state.assigned_channel(row_id) if status == 1 else ""
+        
+        return str(self.viewer.original_df.iat[row_id, self._positions[col - self.EXTRA_COLUMNS]])
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if section < self.EXTRA_COLUMNS:
+                return self.EXTRA_HEADERS[section]
+            col = self._columns[section - self.EXTRA_COLUMNS]
+            # 매핑 정보가 있으면 매핑된 이름 사용, 없으면 원래 이름 사용
+            return str(self.viewer.header_mapping.get(col, col))
+        return super().headerData(section, orientation, role)
+
+
+class RowSubsetProxyModel(QAbstractProxyModel):
+    """공유 모델의 일부 행(행 ID 목록)만 보여주는 탭별 프록시 모델"""
+    
+    def __init__(self, source_model, parent=None):
+        super().__init__(parent)
+        self._row_ids = np.empty(0, dtype=np.int64)  # 화면 행 -> 원본 행 ID (오름차순 유지)
+        self.setSourceModel(source_model)
+        
+        # 원본 모델 변경 사항 전달
+        source_model.dataChanged.connect(self._on_source_data_changed)
+        source_model.modelAboutToBeReset.connect(self.beginResetModel)
+        source_model.modelReset.connect(self._on_source_reset)
+    
+    def set_rows(self, row_ids):
+        """표시할 행 ID 배열 설정 (원본 순서, 정수 배열이면 복사하지 않음)"""
+        self.beginResetModel()
+        if row_ids is None:
+            self._row_ids = np.empty(0, dtype=np.int64)
+        else:
+            self._row_ids = np.asarray(row_ids, dtype=np.int64)
+        self.endResetModel()
+    
+    def position_of(self, row_id):
+        """원본 행 ID가 표시된 화면 행 번호 (없으면 -1)"""
+        pos = int(np.searchsorted(self._row_ids, row_id))
+        if pos < len(self._row_ids) and self._row_ids[pos] == row_id:
+            return pos
+        return -1
+    
+    def insert_row_id(self, row_id):
+        """원본 순서를 유지하며 행 하나 추가"""
+        pos = int(np.searchsorted(self._row_ids, row_id))
+        if pos < len(self._row_ids) and self._row_ids[pos] == row_id:
+            return
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._row_ids = np.insert(self._row_ids, pos, row_id)
+        self.endInsertRows()
+    
+    def remove_row_id(self, row_id):
+        """행 하나 제거"""
+        pos = self.position_of(row_id)
+        if pos < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        self._row_ids = np.delete(self._row_ids, pos)
+        self.endRemoveRows()
+    
+    def row_id_at(self, row):
+        """화면 행 번호에 해당하는 원본 행 ID"""
+        return int(self._row_ids[row])
+    
+    def row_ids(self):
+        """현재 화면에 표시된 원본 행 ID 배열"""
+        return self._row_ids
+    
+    def columns(self):
+        return self.sourceModel().columns()
+    
+    def url_column(self):
+        return self.sourceModel().url_column()
+    
+    def display_text(self, row_id, col, status=None):
+        return self.sourceModel().display_text(row_id, col, status)
+    
+    def _on_source_data_changed(self, top_left, bottom_right, roles=None):
+        """원본 모델에서 바뀐 행 중 이 프록시에 있는 행만 다시 그리기"""
+        if len(self._row_ids) == 0:
+            return
+        last_col = self.columnCount() - 1
+        if top_left.row() == bottom_right.row():
+            pos = self.position_of(top_left.row())
+            if pos >= 0:
+                self.dataChanged.emit(self.index(pos, 0), self.index(pos, last_col))
+        else:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._row_ids) - 1, last_col))
+    
+    def _on_source_reset(self):
+        # 원본 데이터가 바뀌면 기존 행 ID는 더 이상 유효하지 않음
+        self._row_ids = np.empty(0, dtype=np.int64)
+        self.endResetModel()
+    
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self._row_ids[proxy_index.row()]), proxy_index.column())
+    
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        pos = self.position_of(source_index.row())
+        if pos < 0:
+            return QModelIndex()
+        return self.index(pos, source_index.column())
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row >= len(self._row_ids) or column < 0 or column >= self.columnCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+    
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._row_ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.sourceModel().columnCount()
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        # 세로 헤더는 화면 행 번호 표시
+        if role == Qt.DisplayRole:
+            return section + 1
+        return None
@@ -39,6 +39,7 @@ class UIComponents:
         
         owner.contact_search_input = QLineEdit()
         owner.contact_search_input.setPlaceholderText("이름, 연락처, URL 검색")
+        owner.contact_search_input.textChanged.connect(owner.on_contact_search_text_changed)  # 입력하면서 검색
         contact_search_layout.addWidget(owner.contact_search_input, 3)  # 비율 3 (가장 넓게)
         
         # 검색 버튼
@@ -1,2 +1,6 @@
+from .cache_handler import WorkbookCache
 from .excel_handler import ExcelHandler
-from .filter_handler import FilterHandler 
\ No newline at end of file
+from .filter_handler import FilterHandler, FilterPredicate, FilterPlan 
+from .index_handler import (ProductIndex, ChannelIndex, SearchIndex, IdentityClusters,
+                            phone_keys, id_keys, account_url_keys)
+from .state_handler import WorkState, StateJournal, StateSnapshot, StateBackups, SqliteStateStore
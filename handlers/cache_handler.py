@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class WorkbookCache:
+    """전처리가 끝난 엑셀 데이터를 엑셀 파일 옆 Parquet 파일로 보관 (같은 파일을 다시 열면 엑셀 파싱 생략)"""
+
+    VERSION = 3
+    METADATA_KEY = b'paldo_workbook_cache'
+
+    # Parquet 칼럼 이름 접두사 (원본 칼럼 이름은 메타데이터에 따로 저장)
+    ORIGINAL_PREFIX = 'o'
+    NORMALIZED_PREFIX = 'n'
+
+    @staticmethod
+    def cache_path(file_path):
+        """엑셀 파일에 대응하는 캐시 파일 경로"""
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(os.path.dirname(file_path), f"{base_name}_캐시.parquet")
+
+    @staticmethod
+    def content_hash(file_path):
+        """엑셀 파일 내용의 SHA-256"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def fingerprint(file_path, sha256=None):
+        """작업 상태 파일이 어느 엑셀 파일의 것인지 확인하기 위한 지문 {'name', 'size', 'sha256'}
+
+        sha256을 이미 알고 있으면 (캐시 메타데이터 등) 파일을 다시 읽지 않음
+        """
+        return {
+            'name': os.path.basename(file_path),
+            'size': os.path.getsize(file_path),
+            'sha256': sha256 or WorkbookCache.content_hash(file_path),
+        }
+
+    @staticmethod
+    def _read_metadata(path):
+        import pyarrow.parquet as pq
+
+        schema_metadata = pq.read_schema(path).metadata or {}
+        raw = schema_metadata.get(WorkbookCache.METADATA_KEY)
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    def _is_valid(metadata, file_path, header_mapping):
+        """크기, 수정 시각, 내용 해시와 헤더 매핑이 캐시를 만들 때와 같은지 확인"""
+        if metadata.get('version') != WorkbookCache.VERSION:
+            return False
+        if metadata.get('header_mapping') != list(header_mapping):
+            return False
+
+        stat = os.stat(file_path)
+        if metadata.get('size') != stat.st_size:
+            return False
+        # 크기와 수정 시각이 같으면 내용을 다시 읽지 않음 (복사 등으로 수정 시각만 바뀐 경우는 해시로 확인)
+        if metadata.get('mtime_ns') == stat.st_mtime_ns:
+            return True
+        return metadata.get('sha256') == WorkbookCache.content_hash(file_path)
+
+    @staticmethod
+    def load(file_path, header_mapping):
+        """유효한 캐시가 있으면 (원본 데이터프레임, 정규화 칼럼, 칼럼 정보 딕셔너리, 엑셀 파일 SHA-256), 없으면 None"""
+        path = WorkbookCache.cache_path(file_path)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            metadata = WorkbookCache._read_metadata(path)
+            if metadata is None or not WorkbookCache._is_valid(metadata, file_path, header_mapping):
+                return None
+
+            table = pd.read_parquet(path)
+            original_columns = metadata['original_columns']
+            normalized_columns = metadata['normalized_columns']
+
+            # Parquet의 빈 문자열 셀은 None으로 읽히므로 엑셀에서 읽었을 때처럼 NaN으로 되돌림
+            original_df = WorkbookCache._restore(table, WorkbookCache.ORIGINAL_PREFIX, original_columns)
+            normalized_df = WorkbookCache._restore(table, WorkbookCache.NORMALIZED_PREFIX, normalized_columns)
+            return original_df, normalized_df, metadata['column_info'], metadata['sha256']
+
+        except Exception as e:
+            print(f"캐시 불러오기 실패 ({path}): {e}")
+            return None
+
+    @staticmethod
+    def save(file_path, header_mapping, original_df, normalized_df, column_info, sha256=None):
+        """전처리 결과를 캐시 파일로 저장 (실패해도 엑셀 로드는 계속 진행, sha256이 없으면 여기서 계산)"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = WorkbookCache.cache_path(file_path)
+        temp_path = path + '.tmp'
+        try:
+            stat = os.stat(file_path)
+            metadata = {
+                'version': WorkbookCache.VERSION,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': sha256 or WorkbookCache.content_hash(file_path),
+                'header_mapping': list(header_mapping),
+                'original_columns': list(original_df.columns),
+                'normalized_columns': list(normalized_df.columns),
+                'column_info': column_info,
+            }
+
+            # 칼럼 이름 중복/특수문자 문제를 피하기 위해 위치 기반 이름으로 저장
+            table = pd.concat([
+                WorkbookCache._storable(original_df, WorkbookCache.ORIGINAL_PREFIX),
+                WorkbookCache._storable(normalized_df, WorkbookCache.NORMALIZED_PREFIX),
+            ], axis=1)
+            arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+            schema_metadata = dict(arrow_table.schema.metadata or {})
+            schema_metadata[WorkbookCache.METADATA_KEY] = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+            arrow_table = arrow_table.replace_schema_metadata(schema_metadata)
+
+            # 다 쓴 뒤에 교체해서 중간에 실패해도 깨진 캐시가 남지 않게 함
+            pq.write_table(arrow_table, temp_path)
+            os.replace(temp_path, path)
+
+        except Exception as e:
+            print(f"캐시 저장 실패 ({path}): {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _storable(df, prefix):
+        """Parquet으로 저장할 수 있는 형태로 변환 (문자열과 숫자가 섞인 칼럼은 값을 문자열로)"""
+        columns = {}
+        for i in range(len(df.columns)):
+            values = df.iloc[:, i]
+            if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+                # 화면에는 str()로 표시되므로 문자열로 바꿔도 보이는 값은 같음
+                values = values.astype(str).where(values.notna())
+            columns[f"{prefix}{i}"] = values.reset_index(drop=True)
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _restore(table, prefix, columns):
+        """위치 기반 이름으로 저장한 칼럼을 원래 이름의 데이터프레임으로 복원"""
+        restored = table[[f"{prefix}{i}" for i in range(len(columns))]].copy()
+        for i in np.flatnonzero((restored.dtypes == object).to_numpy()):
+            restored.isetitem(i, restored.iloc[:, i].fillna(np.nan))
+        restored.columns = columns
+        return restored
@@ -1,8 +1,20 @@
+import numpy as np
 import pandas as pd
 import re
-from PyQt5.QtWidgets import QMessageBox
+from .cache_handler import WorkbookCache
+from .index_handler import IdentityClusters
 
 class ExcelHandler:
+    # 화면 표시, 필터, 중복 확인에 쓰는 칼럼의 헤더 키워드 (이 칼럼들만 로드 시 읽음)
+    USED_COLUMN_KEYWORDS = ("희망상품", "희망 상품", "상품명", "신청 채널", "신청채널", "연락처", "전화", "카톡", "아이디",
+                            "성함", "이름", "닉네임", "url", "계정 링크", "블로그")
+    CHANNEL_COLUMN_POSITION = 3  # 신청채널(D열)
+    
+    # 고유값 수가 값이 있는 셀 수의 이 비율 이하인 문자열 칼럼은 범주형으로 변환
+    CATEGORY_MAX_RATIO = 0.5
+    # 빈 셀을 NaN으로 두는 Arrow 문자열 형식 (astype(str), 비교 연산 결과가 object 칼럼과 같음)
+    ARROW_STRING_DTYPE = 'string[pyarrow_numpy]'
+    
     @staticmethod
     def format_phone_number(number):
         """전화번호 형식 정리"""
@@ -23,62 +35,350 @@ class ExcelHandler:
             return number_str
     
     @staticmethod
-    def load_excel_file(file_path, parent, header_mapping):
-        """엑셀 파일 로드 및 전처리"""
-        try:
-            # 엑셀 파일 로드
-            original_df = pd.read_excel(file_path)
+    def normalize_phone(values):
+        """전화번호 칼럼을 (숫자만 남긴 값, 화면 표시용 값)으로 변환 (format_phone_number와 같은 규칙)"""
+        text = values.astype(str)
+        digits = text.str.replace(r'\D', '', regex=True)
+        length = digits.str.len()
+        
+        # 11자리는 3-4-4, 10자리는 3-3-4 형식, 나머지는 원래 값 유지
+        display = text.mask(length == 11, digits.str[:3] + '-' + digits.str[3:7] + '-' + digits.str[7:])
+        display = display.mask(length == 10, digits.str[:3] + '-' + digits.str[3:6] + '-' + digits.str[6:])
+        
+        # 빈 셀은 빈 문자열
+        missing = values.isna()
+        return digits.mask(missing, ""), display.mask(missing, "")
+    
+    @staticmethod
+    def compact_dtypes(df):
+        """문자열 칼럼을 메모리를 덜 쓰는 형식으로 변환 (반복되는 값은 범주형, 자유 입력은 Arrow 문자열)"""
+        compact = {}
+        for i in range(len(df.columns)):
+            values = df.iloc[:, i]
             
-            # 연락처/이름/희망상품 칼럼 찾기 및 데이터 전처리
-            contact_column_idx = -1
-            name_column_idx = -1
-            product_column_idx = -1
-            url_column_idx = -1
+            # 캐시에서 읽은 문자열 칼럼은 빈 셀이 NA이므로 NaN 형식으로 맞춤
+            if isinstance(values.dtype, pd.StringDtype):
+                if values.dtype != ExcelHandler.ARROW_STRING_DTYPE:
+                    compact[i] = values.astype(ExcelHandler.ARROW_STRING_DTYPE)
+                continue
             
-            # 매핑된 헤더 정보로 칼럼 매핑
-            for original_header, mapped_header in header_mapping.items():
-                for i, col in enumerate(original_df.columns):
-                    if original_header in str(col):
-                        original_df.rename(columns={col: original_header}, inplace=True)
-                        break
+            if values.dtype != object:
+                continue
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind != 'string' and not kind.startswith('mixed'):
+                continue
+            if kind != 'string':
+                # 문자열과 숫자가 섞인 칼럼은 화면에 표시되는 문자열로 통일
+                values = values.astype(str).where(values.notna())
             
-            # 칼럼 인덱스 찾기 및 데이터 전처리
-            for col in original_df.columns:
-                if ("연락처" in col or "전화" in col) and not ("카톡" in col or "아이디" in col):
-                    # 연락처 칼럼 인덱스 저장
-                    contact_column_idx = original_df.columns.get_loc(col)
-                    original_df[col] = original_df[col].apply(ExcelHandler.format_phone_number)
-                # 이름 칼럼 인덱스 저장
-                if "성함" in col or "이름" in col or "닉네임" in col:
-                    name_column_idx = original_df.columns.get_loc(col)
-                # 희망상품 칼럼 인덱스 저장
-                if "희망상품" in col or "희망 상품" in col:
-                    product_column_idx = original_df.columns.get_loc(col)
-                # URL 칼럼 인덱스 저장
-                col_str = str(col).lower()
-                if "url" in col_str or "계정 링크" in col or "블로그" in col:
-                    url_column_idx = original_df.columns.get_loc(col)
+            if values.nunique() <= values.count() * ExcelHandler.CATEGORY_MAX_RATIO:
+                compact[i] = values.astype('category')
+            else:
+                compact[i] = values.astype(ExcelHandler.ARROW_STRING_DTYPE)
+        
+        if not compact:
+            return df
+        df = df.copy(deep=False)
+        for i, values in compact.items():
+            df.isetitem(i, values)
+        return df
+    
+    @staticmethod
+    def normalize_columns(df):
+        """검색, 중복 확인에 쓰는 정규화 칼럼 생성 (로드 시 pandas 문자열 연산으로 한 번만 계산)
+        
+        phone_digits / phone_display: 숫자만 남긴 전화번호 / 화면 표시용 전화번호
+        kakao_id: 앞뒤 공백 제거 후 소문자로 바꾼 카톡아이디
+        name_lower: 소문자로 바꾼 이름
+        canonical_url: http(s)://와 www.를 뺀 소문자 URL (FilterHandler.clean_url과 같은 규칙)
+        """
+        normalized = pd.DataFrame(index=df.index)
+        for i, col in enumerate(df.columns):
+            col_str = str(col)
+            values = df.iloc[:, i]
+            
+            if "카톡" in col_str or "아이디" in col_str:
+                normalized['kakao_id'] = values.astype(str).str.strip().str.lower().where(values.notna())
+            elif "연락처" in col_str or "전화" in col_str:
+                normalized['phone_digits'], normalized['phone_display'] = ExcelHandler.normalize_phone(values)
             
-            # C열부터 N열 선택 (K열, M열 제외)
-            columns_to_show = []
-            for col in original_df.columns[2:14]:  # C(인덱스 2)부터 N(인덱스 13)까지
-                col_idx = original_df.columns.get_loc(col)
-                # K열(인덱스 10)과 M열(인덱스 12)는 제외
-                if col_idx != 10 and col_idx != 12:
-                    columns_to_show.append(col)
+            if "성함" in col_str or "이름" in col_str or "닉네임" in col_str:
+                normalized['name_lower'] = values.astype(str).str.lower().where(values.notna())
+            
+            if "url" in col_str.lower() or "계정 링크" in col_str or "블로그" in col_str:
+                normalized['canonical_url'] = (values.astype(str).str.strip().str.lower()
+                                               .str.replace(r'^https?://', '', regex=True)
+                                               .str.replace(r'^www\.', '', regex=True)
+                                               .where(values.notna()))
+        return normalized
+    
+    @staticmethod
+    def _load_result(original_df, normalized_df, column_info):
+        """prepare_workbook 반환 딕셔너리 (첫 번째 키는 원본 데이터프레임)"""
+        return {
+            'original_df': original_df, 
+            'normalized_df': normalized_df,
+            **column_info
+        }
+    
+    @staticmethod
+    def display_positions(column_count):
+        """화면에 표시할 칼럼 위치 (C열부터 N열, K열과 M열 제외)"""
+        # C(인덱스 2)부터 N(인덱스 13)까지, K열(인덱스 10)과 M열(인덱스 12)는 제외
+        return [col_idx for col_idx in range(2, min(column_count, 14)) if col_idx != 10 and col_idx != 12]
+    
+    @staticmethod
+    def used_column_positions(columns, header_mapping):
+        """로드 시 읽을 칼럼 위치 (표시 칼럼, 신청채널, 헤더 매핑 대상, 연락처/이름/상품/URL/아이디 칼럼)"""
+        positions = set(ExcelHandler.display_positions(len(columns)))
+        if len(columns) > ExcelHandler.CHANNEL_COLUMN_POSITION:
+            positions.add(ExcelHandler.CHANNEL_COLUMN_POSITION)
+        
+        # 헤더 매핑은 각 헤더를 포함하는 첫 번째 칼럼에 적용됨
+        for original_header in header_mapping:
+            for i, col in enumerate(columns):
+                if original_header in str(col):
+                    positions.add(i)
+                    break
+        
+        for i, col in enumerate(columns):
+            col_str = str(col).lower()
+            if any(keyword in col_str for keyword in ExcelHandler.USED_COLUMN_KEYWORDS):
+                positions.add(i)
+        return sorted(positions)
+    
+    @staticmethod
+    def read_workbook(file_path, progress_callback=None, progress_interval=1000, select_columns=None):
+        """첫 번째 시트를 openpyxl read_only 모드로 한 행씩 읽어 데이터프레임 생성 (pd.read_excel과 같은 결과)
+        
+        select_columns(전체 칼럼 이름 목록)는 헤더 행을 읽은 직후 호출되며, 반환한 위치의 칼럼만 읽음 (None이면 전체)
+        progress_callback(읽은 행 수, 전체 행 수)가 False를 반환하면 읽기를 멈추고 None 반환
+        """
+        # openpyxl로 읽을 수 없는 형식(.xls)은 진행률 없이 pandas로 읽음
+        if not file_path.lower().endswith(('.xlsx', '.xlsm')):
+            df = pd.read_excel(file_path)
+            if select_columns is not None:
+                df = df.iloc[:, sorted(select_columns(list(df.columns)))]
+            return df
+        
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+        from pandas.io.parsers import TextParser
+        
+        def convert(cell):
+            # pandas의 openpyxl 리더와 같은 셀 변환 (빈 셀 "", 오류 NaN, 정수로 떨어지는 실수는 int)
+            value = cell.value
+            if value is None:
+                return ""
+            if cell.data_type == TYPE_ERROR:
+                return np.nan
+            if cell.data_type == TYPE_NUMERIC and int(value) == value:
+                return int(value)
+            return value
+        
+        def column_names(header, width):
+            # 빈 헤더는 'Unnamed: n', 중복 헤더는 '.1' 등을 붙이는 pandas 규칙 그대로 사용
+            return list(TextParser([header + [""] * (width - len(header))], header=0).read().columns)
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
             
-            # 필터링된 데이터프레임 생성
-            filtered_df = original_df[columns_to_show]
+            # 파일에 기록된 시트 크기는 진행률 표시와 헤더 폭에만 사용 (실제 행은 끝까지 읽음)
+            total_rows = max((sheet.max_row or 1) - 1, 0)
+            width = sheet.max_column or 0
+            sheet.reset_dimensions()
             
-            return {
-                'original_df': original_df, 
-                'filtered_df': filtered_df,
-                'contact_column_idx': contact_column_idx,
-                'name_column_idx': name_column_idx,
-                'product_column_idx': product_column_idx,
-                'url_column_idx': url_column_idx
-            }
+            # 헤더 행을 먼저 읽어 읽을 칼럼 위치 결정
+            rows = sheet.rows
+            header = [convert(cell) for cell in next(rows, ())]
+            while header and header[-1] == "":
+                header.pop()
+            width = max(width, len(header))
+            if width == 0:
+                return pd.DataFrame()
+            positions = None
+            if select_columns is not None:
+                names = column_names(header, width)
+                positions = sorted(select_columns(names))
             
-        except Exception as e:
-            QMessageBox.critical(parent, "오류", f"엑셀 파일 로드 중 오류 발생: {str(e)}")
-            return None 
\ No newline at end of file
+            data = []
+            last_row_with_data = 0 if header else -1
+            for row_number, row in enumerate(rows, start=1):
+                # 값이 있는 행인지는 읽지 않는 칼럼까지 포함해 판단 (pd.read_excel과 같은 행 수)
+                if positions is None:
+                    converted_row = [convert(cell) for cell in row]
+                    while converted_row and converted_row[-1] == "":
+                        converted_row.pop()
+                    has_data = bool(converted_row)
+                else:
+                    converted_row = [convert(row[i]) if i < len(row) else "" for i in positions]
+                    has_data = any(cell.value is not None for cell in row)
+                if has_data:
+                    last_row_with_data = row_number
+                data.append(converted_row)
+                
+                if progress_callback is not None and row_number % progress_interval == 0:
+                    if progress_callback(row_number, max(total_rows, row_number)) is False:
+                        return None
+        finally:
+            workbook.close()
+        
+        # 뒤쪽 빈 행 제거
+        if last_row_with_data < 0:
+            return pd.DataFrame()
+        data = data[:last_row_with_data]
+        
+        if positions is None:
+            width = max([width, *(len(data_row) for data_row in data)])
+            names = column_names(header, width)
+            positions = range(width)
+        
+        # 짧은 행은 빈 셀로 채움
+        data = [data_row + [""] * (len(positions) - len(data_row)) for data_row in data]
+        
+        if progress_callback is not None:
+            progress_callback(len(data), len(data))
+        
+        # 빈 셀 NaN 변환, 칼럼별 형식 추론은 pandas 파서에 맡김
+        selected_names = [names[i] for i in positions]
+        if not data:
+            return pd.DataFrame(columns=selected_names)
+        return TextParser(data, names=selected_names, header=None, skip_blank_lines=False).read()
+    
+    @staticmethod
+    def prepare_workbook(file_path, header_mapping, progress_callback=None):
+        """엑셀 파일 로드 및 전처리 (오류는 호출한 쪽에서 처리, 취소되면 None)"""
+        # 같은 파일을 전에 불러온 적이 있으면 캐시에서 전처리 결과를 바로 읽음
+        cached = WorkbookCache.load(file_path, header_mapping)
+        if cached is not None:
+            original_df, normalized_df, column_info, sha256 = cached
+            original_df = ExcelHandler.compact_dtypes(original_df)
+            # 변환 후 메모리 사용량은 지금 메모리에 올라온 데이터프레임 기준으로 다시 계산
+            memory_usage = column_info.get('memory_usage')
+            if memory_usage:
+                column_info['memory_usage'] = [memory_usage[0], int(original_df.memory_usage(deep=True).sum())]
+            # 작업 상태 파일에 기록할 엑셀 파일 지문 (캐시에 저장한 해시 사용)
+            column_info['workbook_fingerprint'] = WorkbookCache.fingerprint(file_path, sha256)
+            return ExcelHandler._load_result(original_df, normalized_df, column_info)
+        
+        # 헤더 행을 먼저 읽고 쓰는 칼럼만 읽음 (화면, 검색, 필터에 쓰지 않는 칼럼은 읽지 않음)
+        sheet_columns = []
+        loaded_positions = []
+        
+        def select_columns(columns):
+            sheet_columns.extend(columns)
+            loaded_positions.extend(ExcelHandler.used_column_positions(columns, header_mapping))
+            return loaded_positions
+        
+        # 엑셀 파일 로드 (취소되면 None)
+        original_df = ExcelHandler.read_workbook(file_path, progress_callback, select_columns=select_columns)
+        if original_df is None:
+            return None
+        
+        # 연락처/이름/희망상품 칼럼 찾기 및 데이터 전처리
+        contact_column_idx = -1
+        name_column_idx = -1
+        product_column_idx = -1
+        url_column_idx = -1
+        
+        # 매핑된 헤더 정보로 칼럼 매핑
+        for original_header, mapped_header in header_mapping.items():
+            for i, col in enumerate(original_df.columns):
+                if original_header in str(col):
+                    original_df.rename(columns={col: original_header}, inplace=True)
+                    break
+        
+        # 칼럼 인덱스 찾기 및 데이터 전처리
+        for col in original_df.columns:
+            if ("연락처" in col or "전화" in col) and not ("카톡" in col or "아이디" in col):
+                # 연락처 칼럼 인덱스 저장
+                contact_column_idx = original_df.columns.get_loc(col)
+                original_df[col] = ExcelHandler.normalize_phone(original_df[col])[1]
+            # 이름 칼럼 인덱스 저장
+            if "성함" in col or "이름" in col or "닉네임" in col:
+                name_column_idx = original_df.columns.get_loc(col)
+            # 희망상품 칼럼 인덱스 저장
+            if "희망상품" in col or "희망 상품" in col:
+                product_column_idx = original_df.columns.get_loc(col)
+            # URL 칼럼 인덱스 저장
+            col_str = str(col).lower()
+            if "url" in col_str or "계정 링크" in col or "블로그" in col:
+                url_column_idx = original_df.columns.get_loc(col)
+        
+        # 검색/중복 확인용 정규화 칼럼 (원본 데이터프레임과 같은 행 ID)
+        normalized_df = ExcelHandler.normalize_columns(original_df)
+        
+        # 같은 지원자 묶음 번호도 로드 단계에서 계산해 캐시에 함께 저장
+        normalized_df['cluster_id'] = IdentityClusters.from_normalized(normalized_df).cluster_ids
+        
+        # 문자열 칼럼을 범주형/Arrow 문자열로 변환하고 변환 전후 메모리 사용량 기록
+        compact_df = ExcelHandler.compact_dtypes(original_df)
+        memory_usage = [int(original_df.memory_usage(deep=True).sum()), int(compact_df.memory_usage(deep=True).sum())]
+        original_df = compact_df
+        
+        # 시트 기준 칼럼 위치 -> 읽은 데이터프레임의 칼럼 위치
+        loaded_index = {position: i for i, position in enumerate(loaded_positions)}
+        channel_position = ExcelHandler.CHANNEL_COLUMN_POSITION
+        
+        column_info = {
+            'contact_column_idx': contact_column_idx,
+            'name_column_idx': name_column_idx,
+            'product_column_idx': product_column_idx,
+            'url_column_idx': url_column_idx,
+            'channel_column_idx': loaded_index.get(channel_position, -1),
+            # C열부터 N열 선택 (K열, M열 제외) - 시트 기준 위치로 계산
+            'display_columns': [original_df.columns[loaded_index[position]]
+                                for position in ExcelHandler.display_positions(len(sheet_columns))],
+            # 형식 변환 전후 메모리 사용량 (바이트)
+            'memory_usage': memory_usage,
+        }
+        # 캐시와 작업 상태 파일에 함께 쓰도록 파일 해시는 한 번만 계산
+        sha256 = WorkbookCache.content_hash(file_path)
+        WorkbookCache.save(file_path, header_mapping, original_df, normalized_df, column_info, sha256)
+        
+        result = ExcelHandler._load_result(original_df, normalized_df, column_info)
+        result['workbook_fingerprint'] = WorkbookCache.fingerprint(file_path, sha256)
+        return result
+    
+    @staticmethod
+    def export_rows(file_path, headers, rows, row_count, progress_callback=None, progress_interval=1000):
+        """openpyxl write_only 모드로 한 행씩 엑셀 파일 저장 (행 전체를 메모리에 모으지 않음)
+        
+        progress_callback(쓴 행 수, 전체 행 수)로 진행 상황 전달, 다 쓴 뒤 임시 파일을 file_path로 교체
+        """
+        import os
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        
+        # pandas to_excel과 같은 헤더 서식 (굵게, 가운데 정렬, 얇은 테두리)
+        thin = Side(style='thin')
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal='center', vertical='top')
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            header_cells.append(cell)
+        sheet.append(header_cells)
+        
+        for rows_written, row in enumerate(rows, start=1):
+            sheet.append(row)
+            if progress_callback is not None and rows_written % progress_interval == 0:
+                progress_callback(rows_written, row_count)
+        
+        # 저장 도중 실패해도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{file_path}.tmp"
+        try:
+            workbook.save(temp_path)
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        if progress_callback is not None:
+            progress_callback(row_count, row_count)
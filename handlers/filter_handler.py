@@ -1,5 +1,81 @@
+import time
+import numpy as np
 import pandas as pd
 
+
+class FilterPredicate:
+    """필터 조건 하나 (행 ID 배열을 받아 같은 길이의 불리언 배열을 돌려줌)"""
+    
+    def __init__(self, name, evaluate, estimate, depends_on_status=False):
+        """
+        초기화
+        
+        Args:
+            name: 조건 이름 (실행 계획 표시용)
+            evaluate: 행 ID 배열 -> 조건을 만족하는지 나타내는 불리언 배열
+            estimate: 예상 통과 행 수 (작을수록 먼저 실행)
+            depends_on_status: 행 상태에 따라 결과가 바뀌는 조건인지 여부
+        """
+        self.name = name
+        self.evaluate = evaluate
+        self.estimate = estimate
+        self.depends_on_status = depends_on_status
+    
+    @classmethod
+    def from_rows(cls, name, matched_rows, row_count):
+        """조건을 만족하는 행 ID 배열로 조건 생성 (예상 통과 행 수는 정확한 값)"""
+        mask = np.zeros(row_count, dtype=bool)
+        mask[matched_rows] = True
+        return cls(name, lambda row_ids: mask[row_ids], len(matched_rows))
+
+
+class FilterPlan:
+    """필터 실행 계획 (예상 통과 행 수가 적은 조건부터, 앞 조건을 통과한 행만 다음 조건으로 확인)"""
+    
+    def __init__(self, row_count, predicates):
+        self.row_count = row_count
+        self.predicates = sorted(predicates, key=lambda predicate: predicate.estimate)
+        self.stages = []  # 마지막 실행 결과 [(조건 이름, 예상 행 수, 입력 행 수, 통과 행 수, 소요 시간(ms))]
+    
+    @property
+    def depends_on_status(self):
+        """행 상태에 따라 결과가 바뀌는 조건이 있는지 여부"""
+        return any(predicate.depends_on_status for predicate in self.predicates)
+    
+    def execute(self):
+        """계획 실행 후 모든 조건을 통과한 행 ID 배열 반환"""
+        row_ids = np.arange(self.row_count)
+        self.stages = []
+        for predicate in self.predicates:
+            # 남은 행이 없으면 나머지 조건은 실행하지 않음
+            if len(row_ids) == 0:
+                break
+            start = time.perf_counter()
+            survivors = row_ids[predicate.evaluate(row_ids)]
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.stages.append((predicate.name, predicate.estimate, len(row_ids), len(survivors), elapsed_ms))
+            row_ids = survivors
+        return row_ids
+    
+    def accepts(self, row_id):
+        """행 하나가 모든 조건을 만족하는지 확인 (상태 변경 시 행 단위 갱신용)"""
+        row_ids = np.array([row_id])
+        return all(predicate.evaluate(row_ids)[0] for predicate in self.predicates)
+    
+    def explain(self):
+        """실행 계획과 조건별 소요 시간 문자열"""
+        if not self.predicates:
+            return f"필터 없음 ({self.row_count}행)"
+        lines = []
+        for i, predicate in enumerate(self.predicates):
+            if i < len(self.stages):
+                name, estimate, rows_in, rows_out, elapsed_ms = self.stages[i]
+                lines.append(f"{i + 1}. {name}: 예상 {estimate}행, {rows_in} -> {rows_out}행, {elapsed_ms:.2f}ms")
+            else:
+                lines.append(f"{i + 1}. {predicate.name}: 예상 {predicate.estimate}행, 건너뜀")
+        return "\n".join(lines)
+
+
 class FilterHandler:
     @staticmethod
     def clean_url(url):
@@ -16,22 +92,78 @@ class FilterHandler:
         return url
     
     @staticmethod
-    def apply_product_filter(df, search_text):
-        """상품명 검색 필터 적용"""
-        if not search_text:
+    def apply_product_filter(df, search_text, product_column_idx):
+        """상품명 검색 필터 적용 (product_column_idx: 희망상품 칼럼 위치)"""
+        if not search_text or product_column_idx < 0:
             return df
             
-        # C열(인덱스 2) 기준으로 필터링
-        c_column = df.columns[2]
-        mask = df[c_column].astype(str).str.contains(search_text, case=False, na=False)
+        # 희망상품 칼럼 기준으로 필터링 (로드한 데이터프레임은 필요한 칼럼만 있으므로 시트 위치가 아닌 칼럼 위치 사용)
+        mask = df.iloc[:, product_column_idx].astype(str).str.contains(search_text, case=False, na=False)
         return df[mask]
     
     @staticmethod
-    def apply_single_product_filter(df):
-        """단일 상품 필터 적용"""
-        c_column = df.columns[2]
+    def build_plan(row_count, predicates):
+        """필터 조건 목록으로 실행 계획 생성 (None인 조건은 제외)"""
+        return FilterPlan(row_count, [predicate for predicate in predicates if predicate is not None])
+    
+    @staticmethod
+    def product_predicate(product_index, selected_product):
+        """희망상품에 상품명이 포함된 행 조건 (상품 역색인 사용)"""
+        if not selected_product or selected_product == "전체" or product_index is None:
+            return None
+        rows = product_index.rows_containing(selected_product)
+        return FilterPredicate.from_rows("상품", rows, product_index.row_count)
+    
+    @staticmethod
+    def single_product_predicate(df, product_index, selected_product, product_column_idx):
+        """단일 상품 조건 ('상품명' 열이 있으면 희망상품에 쉼표가 없고 상품명이 같은 행, 없으면 희망상품이 정확히 같은 행)"""
+        if '상품명' in df.columns:
+            mask = (df['상품명'] == selected_product).to_numpy()
+            # 쉼표 확인은 상품명이 아니라 희망상품 원본 셀 기준 (복수 상품 신청 제외)
+            if product_column_idx >= 0:
+                product_cells = df.iloc[:, product_column_idx]
+                mask = mask & ~product_cells.astype(str).str.contains(',', na=False).to_numpy()
+            return FilterPredicate.from_rows("단일 상품", np.flatnonzero(mask), len(df))
+        if product_index is not None:
+            rows = product_index.rows_equal(selected_product)
+            return FilterPredicate.from_rows("단일 상품", rows, product_index.row_count)
+        return None
+    
+    @staticmethod
+    def search_predicate(search_index, search_text):
+        """이름/연락처/URL 검색 조건 (앞 조건을 통과한 행이 적으면 그 행들만 확인)"""
+        row_count = search_index.row_count
+        
+        def evaluate(row_ids):
+            if len(row_ids) == row_count:
+                return np.isin(row_ids, search_index.match_rows(search_text), assume_unique=True)
+            return np.isin(row_ids, search_index.match_rows(search_text, row_ids), assume_unique=True)
+        
+        return FilterPredicate("검색", evaluate, search_index.estimate_rows(search_text))
+    
+    @staticmethod
+    def channel_predicate(channel_index, selected_channels):
+        """신청채널 조건 (채널 비트마스크 사용)"""
+        bits = channel_index.bits_for(selected_channels)
+        masks = channel_index.masks
+        return FilterPredicate("채널", lambda row_ids: (masks[row_ids] & bits) != 0,
+                               channel_index.estimate_rows(selected_channels))
+    
+    @staticmethod
+    def status_predicate(get_statuses, selected_statuses, status_totals):
+        """행 상태 조건 (get_statuses는 실행 시점의 전체 상태 배열을 돌려줌)"""
+        selected = list(selected_statuses)
+        estimate = int(sum(status_totals[status] for status in selected))
+        return FilterPredicate("상태", lambda row_ids: np.isin(get_statuses()[row_ids], selected),
+                               estimate, depends_on_status=True)
+    
+    @staticmethod
+    def apply_single_product_filter(df, product_column_idx):
+        """단일 상품 필터 적용 (product_column_idx: 희망상품 칼럼 위치)"""
+        if product_column_idx < 0:
+            return df
         # 쉼표가 포함되지 않은 항목만 선택 (단일 상품)
-        mask = ~df[c_column].astype(str).str.contains(',', na=False)
+        mask = ~df.iloc[:, product_column_idx].astype(str).str.contains(',', na=False)
         return df[mask]
     
     @staticmethod
@@ -78,16 +210,13 @@ class FilterHandler:
         return df[~df.index.isin(completed_indices)]
     
     @staticmethod
-    def apply_channel_filter(df, selected_channels):
-        """채널 필터 적용"""
-        if not selected_channels:
+    def apply_channel_filter(df, selected_channels, channel_column_idx):
+        """채널 필터 적용 (channel_column_idx: 신청채널 칼럼 위치)"""
+        if not selected_channels or channel_column_idx < 0:
             return df
-            
-        # D열(인덱스 3) 기준으로 필터링
-        d_column = df.columns[3]
         
         # 선택된 채널 포함 여부 체크를 위한 마스크
-        channel_mask = df[d_column].apply(
+        channel_mask = df.iloc[:, channel_column_idx].apply(
             lambda x: any(channel in str(x) for channel in selected_channels)
         )
         
@@ -0,0 +1,417 @@
+import re
+import numpy as np
+import pandas as pd
+from .filter_handler import FilterHandler
+
+
+def group_rows_by_code(codes, group_count):
+    """그룹 코드 배열을 (정렬된 행 ID 배열, 그룹별 시작 위치) 형태로 묶기
+
+    그룹 g에 속한 행 ID는 order[offsets[g]:offsets[g + 1]] (코드가 -1인 행은 제외)
+    """
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    offsets = np.searchsorted(sorted_codes, np.arange(group_count + 1))
+    return order, offsets
+
+
+def rows_for_codes(order, offsets, codes):
+    """그룹 코드 목록에 해당하는 행 ID 배열 (오름차순)"""
+    parts = [order[offsets[code]:offsets[code + 1]] for code in codes]
+    if not parts:
+        return np.empty(0, dtype=np.int64)
+    if len(parts) == 1:
+        return parts[0]
+    return np.sort(np.concatenate(parts))
+
+
+class ProductIndex:
+    """희망상품 역색인 (상품명 -> 행 ID 배열)"""
+
+    def __init__(self, product_values):
+        """
+        초기화 (엑셀 로드 시 한 번만 생성)
+
+        Args:
+            product_values: 희망상품 칼럼 (Series)
+        """
+        self.row_count = len(product_values)
+
+        # 같은 셀 값을 가진 행끼리 묶기 (빈 셀은 -1)
+        codes, uniques = pd.factorize(product_values)
+        self.codes = codes.astype(np.int32)
+        self.cell_values = [str(value) for value in uniques]
+        self._cell_values_lower = [value.lower() for value in self.cell_values]
+        self._order, self._offsets = group_rows_by_code(self.codes, len(self.cell_values))
+
+        # 셀 값을 쉼표로 나눠 상품명 -> 셀 코드 목록 생성
+        product_cells = {}
+        for code, cell in enumerate(self.cell_values):
+            # 여러 상품이 포함된 경우 분리
+            if ',' in cell:
+                products = [p.strip() for p in cell.split(',')]
+            else:
+                products = [cell.strip()]
+            for product in products:
+                product_cells.setdefault(product, []).append(code)
+
+        # 상품명 -> 행 ID 배열, 상품별 신청 수
+        self.product_rows = {product: self._rows_for_codes(cell_codes)
+                             for product, cell_codes in product_cells.items()}
+        self.product_counts = {product: len(rows) for product, rows in self.product_rows.items()}
+
+        # 검색어별 결과 캐시 (같은 상품을 다시 선택할 때 재계산하지 않음)
+        self._contains_cache = {}
+
+    @property
+    def products(self):
+        """정렬된 상품명 목록"""
+        return sorted(self.product_rows)
+
+    def _rows_for_codes(self, cell_codes):
+        """셀 코드 목록에 해당하는 행 ID 배열 (오름차순)"""
+        return rows_for_codes(self._order, self._offsets, cell_codes)
+
+    def rows_containing(self, text):
+        """희망상품 셀에 text가 포함된 행 ID 배열 (대소문자 무시, str.contains와 동일한 결과)"""
+        key = text.lower()
+        rows = self._contains_cache.get(key)
+        if rows is None:
+            # 고유 셀 값에 대해서만 비교하고 해당 행을 모음
+            cell_codes = [code for code, value in enumerate(self._cell_values_lower) if key in value]
+            rows = self._rows_for_codes(cell_codes)
+            self._contains_cache[key] = rows
+        return rows
+
+    def rows_equal(self, text):
+        """희망상품 셀 값이 text와 정확히 같은 행 ID 배열"""
+        cell_codes = [code for code, value in enumerate(self.cell_values) if value == text]
+        return self._rows_for_codes(cell_codes)
+
+    def mask_for(self, row_ids):
+        """행 ID 배열을 불리언 마스크로 변환"""
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[row_ids] = True
+        return mask
+
+
+class ChannelIndex:
+    """신청채널 비트마스크 (행마다 포함된 채널을 비트로 저장)"""
+
+    def __init__(self, channel_values, channel_list):
+        """
+        초기화 (엑셀 로드 시 한 번만 생성)
+
+        Args:
+            channel_values: 신청채널 칼럼 (Series)
+            channel_list: 채널 이름 목록 (순서대로 비트 0, 1, 2, ...)
+        """
+        self.channels = list(channel_list)
+        self._bits = {channel: 1 << i for i, channel in enumerate(self.channels)}
+        dtype = np.uint8 if len(self.channels) <= 8 else np.uint32
+
+        # 고유 셀 값마다 한 번씩만 채널 포함 여부 확인 (빈 셀은 마지막의 0 사용)
+        codes, uniques = pd.factorize(channel_values)
+        unique_masks = [
+            sum(bit for channel, bit in self._bits.items() if channel in str(value))
+            for value in uniques
+        ]
+        unique_masks.append(0)
+        self.masks = np.array(unique_masks, dtype=dtype)[codes]
+
+        # 채널별 행 수 (실행 계획의 예상 통과 행 수 계산용)
+        self.channel_counts = {channel: int(np.count_nonzero(self.masks & bit))
+                               for channel, bit in self._bits.items()}
+
+    def bits_for(self, channels):
+        """채널 목록에 해당하는 비트 합"""
+        bits = 0
+        for channel in channels:
+            bits |= self._bits.get(channel, 0)
+        return bits
+
+    def has_channels(self, channels):
+        """모든 채널이 색인에 포함되어 있는지 확인"""
+        return all(channel in self._bits for channel in channels)
+
+    def match_mask(self, channels):
+        """선택한 채널 중 하나라도 포함된 행의 불리언 마스크"""
+        return (self.masks & self.bits_for(channels)) != 0
+
+    def estimate_rows(self, channels):
+        """선택한 채널이 포함된 행 수의 상한값 (채널별 행 수의 합)"""
+        return sum(self.channel_counts.get(channel, 0) for channel in channels)
+
+
+class NgramIndex:
+    """문자열 칼럼 부분 문자열 검색용 n-gram 색인 (고유 값 단위로 저장)"""
+
+    GRAM_SIZE = 3
+
+    def __init__(self, values):
+        """
+        초기화
+
+        Args:
+            values: 행별 문자열 (정규화가 끝난 Series)
+        """
+        codes, uniques = pd.factorize(values)
+        self.codes = codes
+        self.values = [str(value) for value in uniques]
+        self._order, self._offsets = group_rows_by_code(codes, len(self.values))
+
+        # n-gram -> 해당 n-gram이 들어 있는 고유 값 번호 목록
+        n = self.GRAM_SIZE
+        postings = {}
+        for value_id, value in enumerate(self.values):
+            for gram in {value[i:i + n] for i in range(len(value) - n + 1)}:
+                postings.setdefault(gram, []).append(value_id)
+        self._postings = postings
+
+    def _candidates(self, text):
+        """text가 포함될 수 있는 고유 값 번호 후보 (검색어의 n-gram 중 가장 드문 것 기준)"""
+        n = self.GRAM_SIZE
+        if len(text) < n:
+            # 짧은 검색어는 고유 값 전체가 후보
+            return range(len(self.values))
+        candidates = None
+        for i in range(len(text) - n + 1):
+            value_ids = self._postings.get(text[i:i + n])
+            if value_ids is None:
+                return []
+            if candidates is None or len(value_ids) < len(candidates):
+                candidates = value_ids
+        return candidates
+
+    def value_ids(self, text):
+        """text가 포함된 고유 값 번호 목록"""
+        return [value_id for value_id in self._candidates(text) if text in self.values[value_id]]
+
+    def estimate_rows(self, text):
+        """text가 포함될 수 있는 행 수 (후보 기준 상한값, 실제 비교 없음)"""
+        candidates = self._candidates(text)
+        if isinstance(candidates, range):
+            return len(self.codes)
+        sizes = self._offsets[1:] - self._offsets[:-1]
+        return int(sizes[candidates].sum()) if candidates else 0
+
+    def rows(self, text, within=None):
+        """text가 포함된 행 ID 배열 (within이 주어지면 그 행들 중에서만 확인)"""
+        if within is None:
+            return rows_for_codes(self._order, self._offsets, self.value_ids(text))
+        
+        # 후보 행의 고유 값만 확인
+        codes = self.codes[within]
+        matched = [code for code in np.unique(codes) if text in self.values[code]]
+        return within[np.isin(codes, matched)]
+
+
+class SearchIndex:
+    """이름/연락처/URL 검색 색인 (엑셀 로드 시 한 번만 생성)"""
+
+    # 전화번호로 볼 수 있는 검색어 (숫자와 구분 기호만)
+    PHONE_QUERY_PATTERN = re.compile(r'[\d\-\s.]+')
+
+    # 소문자 검색어로 비교하는 정규화 칼럼 (이름, 화면 표시용 전화번호, 카톡아이디)
+    TEXT_COLUMNS = ('name_lower', 'phone_display', 'kakao_id')
+
+    def __init__(self, normalized_df):
+        """
+        초기화
+
+        Args:
+            normalized_df: ExcelHandler.normalize_columns로 만든 정규화 칼럼 (빈 셀은 검색되지 않음)
+        """
+        self.row_count = len(normalized_df)
+        self.text_indexes = [NgramIndex(normalized_df[col].fillna('').str.lower())
+                             for col in self.TEXT_COLUMNS if col in normalized_df]
+        self.phone_digits_index = None
+        self.url_index = None
+
+        if 'phone_digits' in normalized_df:
+            self.phone_digits_index = NgramIndex(normalized_df['phone_digits'])
+
+        if 'canonical_url' in normalized_df:
+            self.url_index = NgramIndex(normalized_df['canonical_url'].fillna(''))
+
+        # 직전 검색어와 결과 (검색어가 길어지면 이 결과 안에서만 다시 찾음)
+        self._last_query = None
+        self._last_rows = None
+
+    @classmethod
+    def _query_keys(cls, search_text):
+        """검색어를 칼럼별 비교 형태로 변환 (소문자, 전화번호 숫자, 정리된 URL)"""
+        digits = re.sub(r'\D', '', search_text)
+        if not (digits and cls.PHONE_QUERY_PATTERN.fullmatch(search_text)):
+            digits = None
+        return search_text.lower(), digits, FilterHandler.clean_url(search_text)
+
+    def _narrows(self, previous_text, search_text):
+        """search_text의 결과가 항상 previous_text 결과의 부분집합인지 확인"""
+        previous_key, previous_digits, previous_url = self._query_keys(previous_text)
+        key, digits, url = self._query_keys(search_text)
+        if previous_key not in key or previous_url not in url:
+            return False
+        # 새 검색어가 전화번호 비교를 하면 이전 검색어도 더 짧은 숫자로 비교했어야 함
+        if digits is not None and (previous_digits is None or previous_digits not in digits):
+            return False
+        return True
+
+    def estimate_rows(self, search_text):
+        """검색어가 포함될 수 있는 행 수 (칼럼별 후보 행 수의 합, 실행 계획 정렬용)"""
+        key, digits, clean_search_text = self._query_keys(search_text)
+        estimate = sum(index.estimate_rows(key) for index in self.text_indexes)
+        if self.phone_digits_index is not None and digits is not None:
+            estimate += self.phone_digits_index.estimate_rows(digits)
+        if self.url_index is not None:
+            estimate += self.url_index.estimate_rows(clean_search_text)
+        return min(estimate, self.row_count)
+
+    def match_rows(self, search_text, within=None):
+        """이름, 연락처 또는 URL에 검색어가 포함된 행 ID 배열 (within이 주어지면 그 행들 중에서만 확인)"""
+        if not search_text:
+            return np.empty(0, dtype=np.int64)
+
+        # 직전 검색어를 이어서 입력한 경우 직전 결과 안에서만 확인
+        remember = within is None
+        if remember and self._last_query is not None and self._narrows(self._last_query, search_text):
+            within = self._last_rows
+
+        key, digits, clean_search_text = self._query_keys(search_text)
+        parts = [index.rows(key, within) for index in self.text_indexes]
+
+        # 숫자로만 된 검색어는 하이픈 등을 뺀 전화번호와도 비교
+        if self.phone_digits_index is not None and digits is not None:
+            parts.append(self.phone_digits_index.rows(digits, within))
+
+        if self.url_index is not None:
+            # 검색어에서도 접두사 제거
+            parts.append(self.url_index.rows(clean_search_text, within))
+
+        rows = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+        if remember:
+            # 전체 행에서 찾은 결과만 다음 검색의 범위로 사용
+            self._last_query = search_text
+            self._last_rows = rows
+        return rows
+
+    def match_mask(self, search_text):
+        """이름, 연락처 또는 URL에 검색어가 포함된 행의 불리언 마스크"""
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[self.match_rows(search_text)] = True
+        return mask
+
+
+def phone_keys(phone_digits):
+    """전화번호 비교용 키 (정규화된 숫자 전화번호 중 9자리 이상만)"""
+    return phone_digits.where(phone_digits.str.len() >= 9)
+
+
+def id_keys(kakao_ids):
+    """아이디 비교용 키 (정규화된 아이디에서 공백 제거, 영문/숫자가 3자 이상인 값만)"""
+    keys = kakao_ids.str.replace(r'\s+', '', regex=True)
+    return keys.where(keys.str.count(r'[a-z0-9]') >= 3)
+
+
+# 계정 URL (접두사, www., m. 제거 후 도메인/첫 번째 경로)
+ACCOUNT_URL_PATTERN = r'(?:https?://)?(?:www\.|m\.)?((?:[a-z0-9-]+\.)+[a-z]{2,}/[^\s/?#]+)'
+# 게시물 보기 등 계정이 아닌 경로 (여러 사람이 같은 값을 가질 수 있음)
+SHARED_URL_PATH_PATTERN = r'/[^/]*\.(?:naver|nhn|php|html?|jsp|aspx?)$'
+
+
+def account_url_keys(canonical_urls):
+    """계정 URL 비교용 키 (정규화된 URL에서 추출, 한 셀에 여러 URL이 있으면 행 ID가 반복된 Series)"""
+    urls = canonical_urls.dropna().str.findall(ACCOUNT_URL_PATTERN).explode().dropna()
+    urls = urls[~urls.str.contains(SHARED_URL_PATH_PATTERN, regex=True)]
+    return urls
+
+
+def _link_pairs(keys):
+    """같은 키를 가진 행 쌍 (행 ID, 같은 키의 첫 번째 행 ID)"""
+    keys = keys.dropna()
+    if keys.empty:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    codes, _ = pd.factorize(keys)
+    rows = keys.index.to_numpy(dtype=np.int64)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    first = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+    leaders = rows[order][np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))]
+    linked = rows[order] != leaders
+    return rows[order][linked], leaders[linked]
+
+
+class IdentityClusters:
+    """전화번호, 카톡아이디, 계정 URL 중 하나라도 같은 행을 한 지원자로 묶음 (union-find)"""
+
+    def __init__(self, row_count, key_series):
+        """
+        초기화 (엑셀 로드 시 한 번만 생성)
+
+        Args:
+            row_count: 원본 데이터프레임 행 수
+            key_series: 키 Series 목록 (인덱스는 행 ID, 빈 값은 NaN, 한 행에 여러 키 가능)
+        """
+        parent = np.arange(row_count)
+
+        def find(row_id):
+            root = row_id
+            while parent[root] != root:
+                root = parent[root]
+            # 경로 압축
+            while parent[row_id] != root:
+                parent[row_id], row_id = root, parent[row_id]
+            return root
+
+        # 키가 겹치는 행끼리만 합치므로 반복 횟수는 중복 행 수에 비례
+        for keys in key_series:
+            for row_id, leader in zip(*_link_pairs(keys)):
+                root_a, root_b = find(row_id), find(leader)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        # 모든 행이 대표 행을 바로 가리키도록 정리
+        while True:
+            grand_parent = parent[parent]
+            if np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+
+        # 대표 행 -> 묶음 번호, 묶음별 행 목록
+        codes, roots = pd.factorize(parent)
+        self._set_cluster_ids(codes, len(roots))
+
+    @classmethod
+    def from_normalized(cls, normalized_df):
+        """정규화 칼럼(숫자 전화번호, 카톡아이디, 정리된 URL)으로 묶음 생성"""
+        key_series = []
+        if 'phone_digits' in normalized_df:
+            key_series.append(phone_keys(normalized_df['phone_digits']))
+        if 'kakao_id' in normalized_df:
+            key_series.append(id_keys(normalized_df['kakao_id']))
+        if 'canonical_url' in normalized_df:
+            key_series.append(account_url_keys(normalized_df['canonical_url']))
+        return cls(len(normalized_df), key_series)
+
+    @classmethod
+    def from_cluster_ids(cls, cluster_ids):
+        """이미 계산된 행별 묶음 번호로 생성 (캐시에서 불러올 때)"""
+        clusters = cls.__new__(cls)
+        cluster_ids = np.asarray(cluster_ids)
+        clusters._set_cluster_ids(cluster_ids, int(cluster_ids.max()) + 1 if len(cluster_ids) else 0)
+        return clusters
+
+    def _set_cluster_ids(self, cluster_ids, cluster_count):
+        self.cluster_ids = cluster_ids.astype(np.int32)
+        self.cluster_count = cluster_count
+        self._order, self._offsets = group_rows_by_code(self.cluster_ids, self.cluster_count)
+
+    def rows_of(self, row_id):
+        """행과 같은 지원자로 묶인 행 ID 배열 (자신 포함, 오름차순)"""
+        cluster_id = self.cluster_ids[row_id]
+        return self._order[self._offsets[cluster_id]:self._offsets[cluster_id + 1]]
+
+    def cluster_size(self, row_id):
+        """행이 속한 묶음의 행 수"""
+        cluster_id = self.cluster_ids[row_id]
+        return int(self._offsets[cluster_id + 1] - self._offsets[cluster_id])
@@ -0,0 +1,690 @@
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import struct
+
+import numpy as np
+
+
+class WorkState:
+    """행별 작업 상태 (상태, 지정상품, 지정채널)를 행 ID와 정렬된 배열로 보관"""
+
+    STATUS_COUNT = 5  # 미정, 선정, 대기, 제외, 완료
+
+    def __init__(self, row_count=0):
+        """
+        초기화
+
+        Args:
+            row_count: 원본 데이터프레임 행 수
+        """
+        self.status = np.zeros(row_count, dtype=np.int8)           # 행 상태 (0~4)
+        self.recorded = np.zeros(row_count, dtype=bool)            # 상태가 한 번이라도 지정된 행
+        self.original_status = np.full(row_count, -1, dtype=np.int8)  # 완료로 바뀌기 전 상태 (-1: 없음)
+        self.product_codes = np.full(row_count, -1, dtype=np.int32)   # 지정상품 코드 (-1: 없음)
+        self.channel_codes = np.full(row_count, -1, dtype=np.int16)   # 지정채널 코드 (-1: 없음)
+
+        # 지정상품/지정채널 이름 <-> 코드
+        self.product_names = []
+        self.channel_names = []
+        self._product_lookup = {}
+        self._channel_lookup = {}
+
+        # 마지막 저장 이후 바뀐 행 ID (저널에 바뀐 행만 덧붙이기 위함)
+        self.changed_rows = set()
+
+    def __len__(self):
+        return len(self.status)
+
+    def copy(self):
+        """저장용 사본 (작업 스레드에서 읽는 동안 GUI 스레드에서 계속 바꿀 수 있도록 배열과 이름 목록 복사)"""
+        state = WorkState()
+        state.status = self.status.copy()
+        state.recorded = self.recorded.copy()
+        state.original_status = self.original_status.copy()
+        state.product_codes = self.product_codes.copy()
+        state.channel_codes = self.channel_codes.copy()
+        state.product_names = list(self.product_names)
+        state.channel_names = list(self.channel_names)
+        state._product_lookup = dict(self._product_lookup)
+        state._channel_lookup = dict(self._channel_lookup)
+        return state
+
+    def ensure_size(self, row_count):
+        """행 수가 늘어나면 배열 확장 (기존 상태는 유지)"""
+        extra = row_count - len(self.status)
+        if extra <= 0:
+            return
+        self.status = np.concatenate([self.status, np.zeros(extra, dtype=np.int8)])
+        self.recorded = np.concatenate([self.recorded, np.zeros(extra, dtype=bool)])
+        self.original_status = np.concatenate([self.original_status, np.full(extra, -1, dtype=np.int8)])
+        self.product_codes = np.concatenate([self.product_codes, np.full(extra, -1, dtype=np.int32)])
+        self.channel_codes = np.concatenate([self.channel_codes, np.full(extra, -1, dtype=np.int16)])
+
+    def has_records(self):
+        """상태가 지정된 행이 있는지 확인"""
+        return bool(self.recorded.any())
+
+    # 상태
+
+    def status_of(self, row_id):
+        """행 상태 (범위 밖이면 0)"""
+        if row_id >= len(self.status):
+            return 0
+        return int(self.status[row_id])
+
+    def set_status(self, row_id, status):
+        """행 상태 저장"""
+        self.ensure_size(row_id + 1)
+        self.status[row_id] = status
+        self.recorded[row_id] = True
+        self.changed_rows.add(row_id)
+
+    def statuses(self, row_count):
+        """앞쪽 row_count개 행의 상태 배열"""
+        self.ensure_size(row_count)
+        return self.status[:row_count]
+
+    def status_mask(self, statuses, row_count):
+        """상태가 statuses 중 하나인 행의 불리언 마스크"""
+        return np.isin(self.statuses(row_count), list(statuses))
+
+    def status_counts(self, row_ids=None):
+        """상태별 행 수 {상태: 수} (row_ids가 없으면 상태가 지정된 행 기준)"""
+        if row_ids is None:
+            values = self.status[self.recorded]
+        else:
+            values = self.status[row_ids]
+        counts = np.bincount(values, minlength=self.STATUS_COUNT)
+        return {status: int(count) for status, count in enumerate(counts)}
+
+    def status_totals(self, row_count):
+        """앞쪽 row_count개 행의 상태별 행 수 배열 (상태가 지정되지 않은 행은 미정)"""
+        return np.bincount(self.statuses(row_count), minlength=self.STATUS_COUNT)
+
+    # 완료 전 상태
+
+    def original_status_of(self, row_id):
+        """완료로 바뀌기 전 상태 (없으면 None)"""
+        if row_id >= len(self.original_status) or self.original_status[row_id] < 0:
+            return None
+        return int(self.original_status[row_id])
+
+    def set_original_status(self, row_id, status):
+        self.ensure_size(row_id + 1)
+        self.original_status[row_id] = status
+        self.changed_rows.add(row_id)
+
+    def clear_original_status(self, row_id):
+        if row_id < len(self.original_status):
+            self.original_status[row_id] = -1
+            self.changed_rows.add(row_id)
+
+    # 지정상품 / 지정채널
+
+    def assigned_product(self, row_id):
+        """지정상품 이름 (없으면 빈 문자열)"""
+        return self._name_of(self.product_codes, self.product_names, row_id)
+
+    def set_assigned_product(self, row_id, name):
+        """지정상품 저장 (name이 None이면 삭제)"""
+        self.ensure_size(row_id + 1)
+        self.product_codes[row_id] = self._code_of(name, self.product_names, self._product_lookup)
+        self.changed_rows.add(row_id)
+
+    def assigned_channel(self, row_id):
+        """지정채널 이름 (없으면 빈 문자열)"""
+        return self._name_of(self.channel_codes, self.channel_names, row_id)
+
+    def set_assigned_channel(self, row_id, name):
+        """지정채널 저장 (name이 None이면 삭제)"""
+        self.ensure_size(row_id + 1)
+        self.channel_codes[row_id] = self._code_of(name, self.channel_names, self._channel_lookup)
+        self.changed_rows.add(row_id)
+
+    def product_rows(self, product_name, row_mask=None):
+        """지정상품이 product_name이고 선정(1) 상태인 행 ID 배열"""
+        code = self._product_lookup.get(product_name, -1)
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        match = (self.product_codes == code) & (self.status == 1)
+        if row_mask is not None:
+            match = match[:len(row_mask)] & row_mask
+        return np.flatnonzero(match)
+
+    def selected_channel_counts(self):
+        """선정(1) 상태인 행의 지정채널별 수 {채널: 수}"""
+        codes = self.channel_codes[(self.status == 1) & (self.channel_codes >= 0)]
+        counts = np.bincount(codes, minlength=len(self.channel_names))
+        return {name: int(count) for name, count in zip(self.channel_names, counts) if count > 0}
+
+    def snapshot_rows(self, row_ids):
+        """행 ID 순서대로 (상태, 지정상품, 지정채널) 배열 사본 (작업 스레드에서 읽어도 되도록 복사)
+
+        지정상품/지정채널은 화면과 같이 선정(1) 상태인 행만 값이 있음
+        """
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        if len(row_ids):
+            self.ensure_size(int(row_ids.max()) + 1)
+        statuses = self.status[row_ids]
+        selected = statuses == 1
+
+        # 코드 -1(없음)은 이름 목록 마지막의 빈 문자열을 가리킴
+        products = np.array(self.product_names + [""], dtype=object)[self.product_codes[row_ids]]
+        channels = np.array(self.channel_names + [""], dtype=object)[self.channel_codes[row_ids]]
+        products[~selected] = ""
+        channels[~selected] = ""
+        return statuses, products, channels
+
+    def _set_names(self, product_names, channel_names):
+        """코드 순서대로의 지정상품/지정채널 이름 목록 설정"""
+        self.product_names = list(product_names)
+        self.channel_names = list(channel_names)
+        self._product_lookup = {name: code for code, name in enumerate(self.product_names)}
+        self._channel_lookup = {name: code for code, name in enumerate(self.channel_names)}
+
+    @staticmethod
+    def _name_of(codes, names, row_id):
+        if row_id >= len(codes) or codes[row_id] < 0:
+            return ""
+        return names[codes[row_id]]
+
+    @staticmethod
+    def _code_of(name, names, lookup):
+        if name is None:
+            return -1
+        code = lookup.get(name)
+        if code is None:
+            code = len(names)
+            names.append(name)
+            lookup[name] = code
+        return code
+
+    # 저널 기록
+
+    def take_changes(self):
+        """마지막 호출 이후 바뀐 행 ID 목록 (정렬됨)을 반환하고 변경 목록 비우기"""
+        changed_rows = sorted(self.changed_rows)
+        self.changed_rows = set()
+        return changed_rows
+
+    def row_record(self, row_id):
+        """저널에 기록할 한 행의 전체 상태 (같은 기록을 여러 번 적용해도 결과가 같음)"""
+        original_status = self.original_status_of(row_id)
+        return {
+            'row': int(row_id),
+            'status': int(self.status[row_id]) if self.recorded[row_id] else None,
+            'original': original_status,
+            'product': self._name_of(self.product_codes, self.product_names, row_id) or None,
+            'channel': self._name_of(self.channel_codes, self.channel_names, row_id) or None,
+        }
+
+    def apply_record(self, record):
+        """row_record로 만든 기록을 상태 배열에 반영"""
+        row_id = record['row']
+        self.ensure_size(row_id + 1)
+        if record.get('status') is None:
+            self.status[row_id] = 0
+            self.recorded[row_id] = False
+        else:
+            self.set_status(row_id, record['status'])
+        original_status = record.get('original')
+        self.original_status[row_id] = -1 if original_status is None else original_status
+        self.set_assigned_product(row_id, record.get('product'))
+        self.set_assigned_channel(row_id, record.get('channel'))
+
+    # JSON 저장 형식 변환
+
+    def to_dict(self):
+        """JSON 저장 형식 {'row_status': {...}, 'assigned_products': {...}, 'assigned_channels': {...}, 'original_status': {...}}"""
+        # JSON은 키로 문자열만 허용하므로 행 ID를 문자열로 변환
+        row_status = {str(row_id): int(self.status[row_id]) for row_id in np.flatnonzero(self.recorded)}
+        assigned_products = {str(row_id): self.product_names[self.product_codes[row_id]]
+                             for row_id in np.flatnonzero(self.product_codes >= 0)}
+        assigned_channels = {str(row_id): self.channel_names[self.channel_codes[row_id]]
+                             for row_id in np.flatnonzero(self.channel_codes >= 0)}
+        original_status = {str(row_id): int(self.original_status[row_id])
+                           for row_id in np.flatnonzero(self.original_status >= 0)}
+        return {
+            'row_status': row_status,
+            'assigned_products': assigned_products,
+            'assigned_channels': assigned_channels,
+            'original_status': original_status,
+        }
+
+    @classmethod
+    def from_dict(cls, state_data, row_count=0):
+        """JSON에서 읽은 딕셔너리로 작업 상태 생성"""
+        row_status = {int(k): v for k, v in state_data.get('row_status', {}).items()}
+        assigned_products = {int(k): v for k, v in state_data.get('assigned_products', {}).items()}
+        assigned_channels = {int(k): v for k, v in state_data.get('assigned_channels', {}).items()}
+        # 1.1 이전 파일에는 완료 전 상태가 없음
+        original_status = {int(k): v for k, v in state_data.get('original_status', {}).items()}
+
+        max_row_id = max([-1, *row_status, *assigned_products, *assigned_channels, *original_status])
+        state = cls(max(row_count, max_row_id + 1))
+
+        for row_id, status in row_status.items():
+            state.set_status(row_id, status)
+        for row_id, name in assigned_products.items():
+            state.set_assigned_product(row_id, name)
+        for row_id, name in assigned_channels.items():
+            state.set_assigned_channel(row_id, name)
+        for row_id, status in original_status.items():
+            state.set_original_status(row_id, status)
+        state.changed_rows = set()
+        return state
+
+
+
+class StateJournal:
+    """작업 상태 JSON 스냅샷 뒤에 바뀐 행만 한 줄씩 덧붙이는 저널 (불러올 때 스냅샷 + 저널 순서로 재생)"""
+
+    VERSION = '1.2'
+    # 저널 기록 수가 이 값과 상태가 지정된 행 수 중 큰 값을 넘으면 스냅샷으로 합침
+    COMPACT_MIN_RECORDS = 5000
+
+    def __init__(self, snapshot_path, record_count=0, fingerprint=None):
+        """
+        초기화
+
+        Args:
+            snapshot_path: 작업 상태 스냅샷 파일 경로 (.state면 바이너리, 그 외는 JSON)
+            record_count: 저널에 이미 있는 기록 수
+            fingerprint: 스냅샷에 함께 기록할 엑셀 파일 지문 (WorkbookCache.fingerprint)
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = StateJournal.journal_path_of(snapshot_path)
+        self.record_count = record_count
+        self.fingerprint = fingerprint
+
+    @staticmethod
+    def journal_path_of(snapshot_path):
+        """스냅샷 JSON에 대응하는 저널 파일 경로"""
+        # 확장자까지 포함해야 같은 이름의 .json/.state 스냅샷이 저널을 함께 쓰지 않음
+        return snapshot_path + '.journal'
+
+    @staticmethod
+    def take_records(work_state):
+        """마지막 저장 이후 바뀐 행의 저널 기록 목록 (변경 목록은 비움)"""
+        return [work_state.row_record(row_id) for row_id in work_state.take_changes()]
+
+    def append(self, records, work_state):
+        """take_records로 꺼낸 기록을 저널에 덧붙이고 한 번에 fsync
+
+        기록이 충분히 쌓이면 work_state (기록을 꺼낸 시점의 사본)로 스냅샷을 새로 씀
+        """
+        if records:
+            lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self.record_count += len(records)
+
+        if self.record_count >= max(StateJournal.COMPACT_MIN_RECORDS, int(work_state.recorded.sum())):
+            self.compact(work_state)
+
+    def compact(self, work_state):
+        """현재 상태 전체를 스냅샷으로 쓰고 저널 비우기"""
+        StateJournal.write_snapshot(self.snapshot_path, work_state, self.fingerprint)
+        work_state.take_changes()
+        self.reset()
+
+    def reset(self):
+        """스냅샷에 모든 변경이 반영된 뒤 저널 비우기"""
+        # 스냅샷을 먼저 교체하므로 여기서 중단되어도 저널 재생 결과는 같음
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.record_count = 0
+
+    @staticmethod
+    def write_snapshot(snapshot_path, work_state, fingerprint=None):
+        """작업 상태 전체를 스냅샷 파일로 저장 (임시 파일에 다 쓴 뒤 교체)"""
+        if snapshot_path.endswith(StateSnapshot.EXTENSION):
+            StateSnapshot.write(snapshot_path, work_state, fingerprint)
+            return
+
+        state_data = work_state.to_dict()
+        state_data['version'] = StateJournal.VERSION  # 버전 정보 추가
+        if fingerprint is not None:
+            state_data['workbook'] = fingerprint
+
+        temp_path = snapshot_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state_data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, snapshot_path)
+
+    @staticmethod
+    def load(snapshot_path, row_count=0):
+        """스냅샷을 읽고 저널이 있으면 재생해 (작업 상태, 저널) 반환 (스냅샷의 엑셀 파일 지문은 journal.fingerprint)"""
+        if snapshot_path.endswith(StateSnapshot.EXTENSION):
+            work_state, fingerprint = StateSnapshot.read(snapshot_path, row_count)
+        else:
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                state_data = json.load(f)
+            work_state = WorkState.from_dict(state_data, row_count)
+            fingerprint = state_data.get('workbook')
+
+        record_count = 0
+        journal_path = StateJournal.journal_path_of(snapshot_path)
+        if os.path.exists(journal_path):
+            valid_size = 0
+            with open(journal_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    work_state.apply_record(record)
+                    record_count += 1
+                    valid_size += len(line)
+            work_state.take_changes()
+
+            # 쓰는 도중 중단된 마지막 줄은 잘라내야 이후 기록이 그 뒤에 이어 붙지 않음
+            if valid_size < os.path.getsize(journal_path):
+                os.truncate(journal_path, valid_size)
+
+        return work_state, StateJournal(snapshot_path, record_count, fingerprint)
+
+
+class StateSnapshot:
+    """작업 상태 배열을 그대로 담는 바이너리 스냅샷 (.state)
+
+    [MAGIC 8바이트][헤더 길이 uint32][헤더 JSON][8바이트 단위로 정렬한 배열들]
+    헤더에는 형식 버전, 행 수, 엑셀 파일 지문, 지정상품/지정채널 이름 표, 배열 위치가 들어감
+    """
+
+    MAGIC = b'PALDOST\x00'
+    VERSION = 1
+    EXTENSION = '.state'
+    ALIGNMENT = 8
+
+    # (WorkState 속성, 저장 dtype) - 바이트 순서를 고정해 다른 기기에서도 그대로 읽음
+    ARRAYS = (
+        ('status', '<i1'),
+        ('recorded', '|b1'),
+        ('original_status', '<i1'),
+        ('product_codes', '<i4'),
+        ('channel_codes', '<i2'),
+    )
+
+    @staticmethod
+    def _aligned(size):
+        return -(-size // StateSnapshot.ALIGNMENT) * StateSnapshot.ALIGNMENT
+
+    @staticmethod
+    def write(path, work_state, fingerprint=None):
+        """작업 상태를 바이너리 스냅샷으로 저장 (임시 파일에 다 쓴 뒤 교체)"""
+        arrays = []
+        layout = []
+        offset = 0
+        for name, dtype in StateSnapshot.ARRAYS:
+            values = np.ascontiguousarray(getattr(work_state, name), dtype=dtype)
+            arrays.append(values)
+            layout.append([name, dtype, offset, len(values)])
+            offset += StateSnapshot._aligned(values.nbytes)
+
+        header = json.dumps({
+            'version': StateSnapshot.VERSION,
+            'row_count': len(work_state),
+            'workbook': fingerprint,
+            'product_names': work_state.product_names,
+            'channel_names': work_state.channel_names,
+            'arrays': layout,
+        }, ensure_ascii=False).encode('utf-8')
+        prefix = StateSnapshot.MAGIC + struct.pack('<I', len(header)) + header
+
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(prefix)
+            f.write(bytes(StateSnapshot._aligned(len(prefix)) - len(prefix)))
+            for values in arrays:
+                f.write(values.tobytes())
+                f.write(bytes(StateSnapshot._aligned(values.nbytes) - values.nbytes))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def read(path, row_count=0):
+        """바이너리 스냅샷을 읽어 (작업 상태, 엑셀 파일 지문) 반환"""
+        # 파일을 한 번에 읽고 배열은 버퍼에서 바로 복사 (메모리 매핑은 창을 닫을 때까지 파일이 잠겨 쓰지 않음)
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic_length = len(StateSnapshot.MAGIC)
+        if data[:magic_length] != StateSnapshot.MAGIC:
+            raise ValueError("작업 상태 스냅샷 파일이 아닙니다.")
+        header_length, = struct.unpack_from('<I', data, magic_length)
+        header_start = magic_length + 4
+        header = json.loads(data[header_start:header_start + header_length].decode('utf-8'))
+        if header.get('version', 0) > StateSnapshot.VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {header.get('version')}")
+
+        data_start = StateSnapshot._aligned(header_start + header_length)
+        work_state = WorkState()
+        for name, dtype, offset, count in header['arrays']:
+            values = np.frombuffer(data, dtype=dtype, count=count, offset=data_start + offset)
+            setattr(work_state, name, values.astype(getattr(work_state, name).dtype))
+        work_state._set_names(header['product_names'], header['channel_names'])
+        work_state.ensure_size(row_count)
+        return work_state, header.get('workbook')
+
+
+class StateBackups:
+    """작업 상태 파일 백업 (bak 폴더에 gzip으로 저장, 직전 백업과 내용이 같으면 생략, 시간/일 단위로만 남김)"""
+
+    DIRECTORY = "bak"
+    KEEP_RECENT = 10  # 항상 남기는 최근 백업 수
+    KEEP_HOURLY = 24  # 시간별 마지막 백업을 남기는 시간 수
+    KEEP_DAILY = 30   # 일별 마지막 백업을 남기는 일 수
+    HASH_LENGTH = 16  # 파일 이름에 넣는 내용 해시 길이
+
+    @staticmethod
+    def backup_dir(snapshot_path):
+        return os.path.join(os.path.dirname(snapshot_path), StateBackups.DIRECTORY)
+
+    @staticmethod
+    def list_backups(snapshot_path):
+        """스냅샷의 백업 목록 [(시각, 내용 해시, 경로)] (최신순, 예전 .bak 파일은 해시가 None)"""
+        backup_dir = StateBackups.backup_dir(snapshot_path)
+        if not os.path.isdir(backup_dir):
+            return []
+
+        # {파일 이름}.{YYYYmmddHHMMSS}[.{해시}].bak[.gz]
+        pattern = re.compile(re.escape(os.path.basename(snapshot_path)) +
+                             r'\.(\d{14})(?:\.([0-9a-f]+))?\.bak(?:\.gz)?$')
+        backups = []
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match:
+                    backups.append((match.group(1), match.group(2), entry.path))
+        backups.sort(reverse=True)
+        return backups
+
+    @staticmethod
+    def backup(snapshot_path):
+        """덮어쓰기 전에 기존 스냅샷을 백업하고 오래된 백업 정리 (만든 백업 경로, 생략했으면 None)
+
+        실패해도 저장은 계속 진행
+        """
+        if not os.path.exists(snapshot_path):
+            return None
+
+        try:
+            with open(snapshot_path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()[:StateBackups.HASH_LENGTH]
+
+            # 직전 백업과 내용이 같으면 새로 만들지 않음
+            backups = StateBackups.list_backups(snapshot_path)
+            if backups and backups[0][1] == digest:
+                return None
+
+            timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+            backup_dir = StateBackups.backup_dir(snapshot_path)
+            os.makedirs(backup_dir, exist_ok=True)
+            backup_path = os.path.join(backup_dir, f"{os.path.basename(snapshot_path)}.{timestamp}.{digest}.bak.gz")
+
+            temp_path = backup_path + '.tmp'
+            with gzip.open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, backup_path)
+
+            StateBackups.prune(snapshot_path)
+            return backup_path
+
+        except Exception as e:
+            print(f"백업 실패 ({snapshot_path}): {e}")
+            return None
+
+    @staticmethod
+    def prune(snapshot_path):
+        """최근 백업과 시간별/일별 마지막 백업만 남기고 삭제"""
+        backups = StateBackups.list_backups(snapshot_path)
+        keep = {path for _, _, path in backups[:StateBackups.KEEP_RECENT]}
+
+        # 시각 문자열 앞부분 (YYYYmmddHH, YYYYmmdd)이 같은 백업 중 가장 최근 것만 남김
+        for prefix_length, bucket_count in ((10, StateBackups.KEEP_HOURLY), (8, StateBackups.KEEP_DAILY)):
+            buckets = set()
+            for timestamp, _, path in backups:
+                bucket = timestamp[:prefix_length]
+                if bucket in buckets:
+                    continue
+                if len(buckets) >= bucket_count:
+                    break
+                buckets.add(bucket)
+                keep.add(path)
+
+        for _, _, path in backups:
+            if path not in keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class SqliteStateStore:
+    """작업 상태를 SQLite 파일에 보관 (클릭 한 번의 변경이 트랜잭션 하나, 불러오기는 쿼리 하나)"""
+
+    SCHEMA_VERSION = 1
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS products (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS channels (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS row_state (
+            row_id INTEGER PRIMARY KEY,
+            status INTEGER,           -- NULL: 상태가 지정되지 않음
+            original_status INTEGER,  -- 완료로 바뀌기 전 상태
+            product_id INTEGER REFERENCES products (id),
+            channel_id INTEGER REFERENCES channels (id)
+        );
+        CREATE INDEX IF NOT EXISTS row_state_status ON row_state (status);
+        CREATE INDEX IF NOT EXISTS row_state_original_status ON row_state (original_status);
+        CREATE INDEX IF NOT EXISTS row_state_product ON row_state (product_id);
+        CREATE INDEX IF NOT EXISTS row_state_channel ON row_state (channel_id);
+    """
+
+    def __init__(self, path):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (없으면 새로 만듦)
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        # 클릭마다 커밋하므로 WAL 모드에서 체크포인트 때만 fsync
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            self.connection.executescript(SqliteStateStore.SCHEMA)
+            self.connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                                    (str(SqliteStateStore.SCHEMA_VERSION),))
+        # 상품/채널 이름 -> ID
+        self._name_ids = {'products': {}, 'channels': {}}
+
+    def close(self):
+        self.connection.close()
+
+    def _name_id(self, table, name):
+        """상품/채널 이름의 ID (없으면 추가, 이름이 None이면 None)"""
+        if name is None:
+            return None
+        name_ids = self._name_ids[table]
+        name_id = name_ids.get(name)
+        if name_id is None:
+            self.connection.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+            name_id = self.connection.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+            name_ids[name] = name_id
+        return name_id
+
+    def _write_records(self, records):
+        upserts = []
+        deletes = []
+        for record in records:
+            values = (record['status'], record['original'],
+                      self._name_id('products', record['product']), self._name_id('channels', record['channel']))
+            if all(value is None for value in values):
+                deletes.append((record['row'],))
+            else:
+                upserts.append((record['row'], *values))
+
+        self.connection.executemany("DELETE FROM row_state WHERE row_id = ?", deletes)
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO row_state (row_id, status, original_status, product_id, channel_id) "
+            "VALUES (?, ?, ?, ?, ?)", upserts)
+
+    def write_changes(self, work_state):
+        """마지막 저장 이후 바뀐 행을 한 트랜잭션으로 기록 (기록한 행 수 반환)"""
+        records = StateJournal.take_records(work_state)
+        if records:
+            try:
+                with self.connection:
+                    self._write_records(records)
+            except Exception:
+                # 롤백된 행은 다음 저장 때 다시 기록되도록 변경 목록에 되돌림
+                work_state.changed_rows.update(record['row'] for record in records)
+                self._name_ids = {'products': {}, 'channels': {}}
+                raise
+        return len(records)
+
+    def write_all(self, work_state):
+        """현재 상태 전체로 파일 내용을 바꿈 (한 트랜잭션)"""
+        work_state.take_changes()
+        row_ids = np.flatnonzero(work_state.recorded | (work_state.original_status >= 0) |
+                                 (work_state.product_codes >= 0) | (work_state.channel_codes >= 0))
+        with self.connection:
+            self.connection.execute("DELETE FROM row_state")
+            self._write_records([work_state.row_record(row_id) for row_id in row_ids])
+
+    def load(self, row_count=0):
+        """저장된 상태를 쿼리 하나로 읽어 작업 상태 생성"""
+        rows = self.connection.execute(
+            "SELECT r.row_id, r.status, r.original_status, p.name, c.name FROM row_state r "
+            "LEFT JOIN products p ON p.id = r.product_id "
+            "LEFT JOIN channels c ON c.id = r.channel_id").fetchall()
+
+        max_row_id = max((row[0] for row in rows), default=-1)
+        work_state = WorkState(max(row_count, max_row_id + 1))
+        for row_id, status, original_status, product, channel in rows:
+            if status is not None:
+                work_state.set_status(row_id, status)
+            if original_status is not None:
+                work_state.set_original_status(row_id, original_status)
+            if product is not None:
+                work_state.set_assigned_product(row_id, product)
+            if channel is not None:
+                work_state.set_assigned_channel(row_id, channel)
+        work_state.take_changes()
+        return work_state
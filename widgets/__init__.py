@@ -1,2 +1,3 @@
 from .buttons import StatusButton
-from .table_items import URLTableWidgetItem 
\ No newline at end of file
+from .table_items import URLTableWidgetItem 
+from .status_delegate import StatusDelegate, STATUS_ROLE
\ No newline at end of file
@@ -9,12 +9,19 @@ class StatusButton(QPushButton):
         self.setText("")
         self.clicked.connect(self.change_status)
         
+    @staticmethod
+    def next_status(status):
+        """클릭 시 다음 상태 (완료 상태(4)는 수동으로 변경할 수 없음)"""
+        if status == 4:
+            return status
+        return (status + 1) % 4  # 0, 1, 2, 3만 순환
+        
     def change_status(self):
         # 완료 상태(4)는 수동으로 변경할 수 없음
         if self.status == 4:
             return
             
-        self.status = (self.status + 1) % 4  # 0, 1, 2, 3만 순환
+        self.status = StatusButton.next_status(self.status)
         self.update_color()
         
     def update_color(self):
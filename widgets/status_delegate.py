@@ -0,0 +1,62 @@
+from PyQt5.QtWidgets import QStyledItemDelegate
+from PyQt5.QtCore import Qt, QEvent, QSize
+from PyQt5.QtGui import QColor, QPen, QPainter
+from .buttons import StatusButton
+
+# 모델에서 행 상태 값을 읽기 위한 역할
+STATUS_ROLE = Qt.UserRole + 1
+
+class StatusDelegate(QStyledItemDelegate):
+    """상태 칼럼을 버튼 모양으로 그리고 클릭 시 상태를 변경하는 델리게이트"""
+    
+    # StatusButton과 동일한 색상 (배경색, 글자색)
+    STATUS_COLORS = {
+        0: ("#F0F0F0", "#000000"),  # 기본
+        1: ("#CCFFCC", "#006600"),  # 파스텔 초록
+        2: ("#FFFACD", "#8B8000"),  # 파스텔 노랑
+        3: ("#FFCCCC", "#CC0000"),  # 파스텔 빨강
+        4: ("#999999", "#FFFFFF")   # 진한 회색, 흰색 텍스트
+    }
+    STATUS_TEXTS = {0: "", 1: "선정", 2: "대기", 3: "제외", 4: "완료"}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 색상 객체는 한 번만 생성
+        self._colors = {status: (QColor(bg), QColor(fg))
+                        for status, (bg, fg) in self.STATUS_COLORS.items()}
+        self._border_pen = QPen(QColor("#ADADAD"))
+    
+    def paint(self, painter, option, index):
+        status = index.data(STATUS_ROLE) or 0
+        bg_color, fg_color = self._colors.get(status, self._colors[0])
+        
+        # 버튼 크기(80x30)에 맞춰 셀 안쪽 영역에 그리기
+        rect = option.rect.adjusted(2, 2, -2, -2)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._border_pen)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.setPen(fg_color)
+        painter.drawText(rect, Qt.AlignCenter, self.STATUS_TEXTS.get(status, ""))
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        return QSize(80, 30)
+    
+    def editorEvent(self, event, model, option, index):
+        """셀 클릭 시 StatusButton과 같은 규칙으로 다음 상태 요청"""
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            status = index.data(STATUS_ROLE) or 0
+            new_status = StatusButton.next_status(status)
+            if new_status != status:
+                model.setData(index, new_status, Qt.EditRole)
+            return True
+        
+        # 더블클릭 등으로 편집기가 열리지 않도록 처리
+        if event.type() == QEvent.MouseButtonDblClick:
+            return True
+        
+        return super().editorEvent(event, model, option, index)